@@ -7,36 +7,77 @@ packaged into the standalone Windows executable.
 Usage:
     Kokoro72CLI.exe --text "Hello world" --out hello.wav
     Kokoro72CLI.exe --text-file script.txt --voice am_adam --out speech.mp3
+    Kokoro72CLI.exe --text "Hello world" --out - | ffplay -nodisp -
     Kokoro72CLI.exe --list-voices
 """
 
 import sys
+from typing import List, Optional
 
-# Apply runtime patches BEFORE any other imports
-# This must happen first to configure espeak and patch spaCy
+# Only lightweight modules are imported here; the TTS stack (torch, kokoro,
+# phonemizer) is imported inside main() once synthesis is actually requested,
+# so --help, --list-voices and --list-languages return instantly.
 from kokoro_announce.patches import apply_all_patches
-apply_all_patches()
-
-# Now import the rest
-from kokoro_announce import KokoroAnnouncer, KokoroSettings, ValidationError
+from kokoro_announce.ssl_env import load_ssl_env
+from kokoro_announce.validation import ValidationError
 from kokoro_announce.cli import (
     create_parser,
     list_voices,
     list_languages,
     validate_args,
+    writes_to_stdout,
     get_output_format,
     print_synthesis_info,
 )
 
 
+# Flags that short-circuit synthesis and can be served by a minimal parser,
+# with the only arguments each one may be combined with on the fast path
+_LIST_FLAGS = {
+    "--list-voices": frozenset({"--list-voices", "--from-disk"}),
+    "--list-languages": frozenset({"--list-languages"}),
+}
+
+
+def _sniff_mode(argv: List[str]) -> Optional[str]:
+    """
+    Detect a list command in argv without building the full parser.
+
+    Anything beyond the flags the list command accepts (help requests,
+    other options, typos) is left to the full parser, so it is validated
+    and reported the same way as for any other invocation.
+
+    Returns:
+        The list flag found in argv, or None for the full CLI
+    """
+    for flag, allowed in _LIST_FLAGS.items():
+        if flag in argv:
+            return flag if allowed.issuperset(argv) else None
+
+    return None
+
+
+def _run_list_command(argv: List[str]) -> int:
+    """Handle list commands straight from argv, without argparse."""
+    if "--list-voices" in argv:
+        list_voices(from_disk="--from-disk" in argv)
+    else:
+        list_languages()
+    return 0
+
+
 def main() -> int:
     """Main entry point for the CLI."""
+    argv = sys.argv[1:]
+    if _sniff_mode(argv) is not None:
+        return _run_list_command(argv)
+
     parser = create_parser()
     args = parser.parse_args()
 
     # Handle list commands (no text required)
     if args.list_voices:
-        list_voices()
+        list_voices(from_disk=args.from_disk)
         return 0
 
     if args.list_languages:
@@ -50,6 +91,12 @@ def main() -> int:
             "(unless using --list-voices or --list-languages)"
         )
 
+    audio_stream = None
+    if writes_to_stdout(args):
+        # stdout carries the audio, so route status messages to stderr
+        audio_stream = sys.stdout.buffer
+        sys.stdout = sys.stderr
+
     try:
         # Validate all arguments
         text, output_path = validate_args(args)
@@ -67,18 +114,37 @@ def main() -> int:
             verbose=args.verbose,
         )
 
+        # Apply runtime patches BEFORE importing the TTS stack
+        # This must happen first to configure espeak and patch spaCy
+        apply_all_patches()
+        # SSL settings saved by fix_ssl.py, needed if models get downloaded
+        load_ssl_env()
+        from kokoro_announce import KokoroAnnouncer, KokoroSettings
+
         # Create settings and announcer
         settings = KokoroSettings(
             lang_code=args.lang,
             voice=args.voice,
             speed=args.speed,
             device=args.device,
+            backend=args.backend,
+            quantize=args.quantize,
+            audio_cache=not args.no_cache,
             sample_rate=args.sample_rate,
         )
 
         announcer = KokoroAnnouncer(settings)
 
         # Synthesize
+        if audio_stream is not None:
+            announcer.synthesize_to_stream(
+                text,
+                audio_stream,
+                format=output_format,
+            )
+            print("[OK] Wrote audio to stdout")
+            return 0
+
         out_path = announcer.synthesize_to_file(
             text,
             output_path,
@@ -24,6 +24,9 @@ def collect_models():
     # Recursively add all files from models/ preserving full structure
     for root, dirs, files in os.walk(models_dir):
         for file in files:
+            # Written by models_exist() for the build machine's files only
+            if file == '.kokoro_verified_v1':
+                continue
             src = Path(root) / file
             # Preserve the full path relative to project root
             # e.g., models/kokoro-82m/config.json -> models/kokoro-82m
@@ -143,7 +146,11 @@ a = Analysis(
         'kokoro_announce.audio',
         'kokoro_announce.patches',
         'kokoro_announce.cli',
+        'kokoro_announce.voice_catalog',
+        'kokoro_announce.ssl_env',
+        'kokoro_announce.cache',
         'soundfile',
+        'lameenc',
         'numpy',
         'torch',
         'transformers',
@@ -184,7 +191,9 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    # UPX-packed binaries must be decompressed on every launch, which slows
+    # startup (and trips antivirus scanners), for a one-time size saving
+    upx=False,
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -200,7 +209,7 @@ coll = COLLECT(
     a.zipfiles,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     name='KTTS72',
 )
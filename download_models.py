@@ -1,75 +1,70 @@
 """Download Kokoro models and voices for supported languages."""
+import argparse
 import os
-import ssl
-import urllib3
-from huggingface_hub import hf_hub_download
+import zipfile
 from pathlib import Path
 
-# Handle SSL issues in corporate environments
-try:
-    # Disable SSL verification warnings
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
-    # Try to use system certificates first
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    
-    # Set environment variables for requests/urllib3
-    os.environ['CURL_CA_BUNDLE'] = ''
-    os.environ['REQUESTS_CA_BUNDLE'] = ''
-    
-except Exception as e:
-    print(f"Warning: SSL configuration failed: {e}")
-    print("Proceeding with default SSL settings...")
-
-repo = 'hexgrad/Kokoro-82M'
-
-# Supported voices: English (US/UK), French, Spanish
-# Total: 32 voices
-VOICES = {
-    # American English (20 voices)
-    'af_alloy': 'American Female',
-    'af_aoede': 'American Female',
-    'af_bella': 'American Female',
-    'af_heart': 'American Female',
-    'af_jessica': 'American Female',
-    'af_kore': 'American Female',
-    'af_nicole': 'American Female',
-    'af_nova': 'American Female',
-    'af_river': 'American Female',
-    'af_sarah': 'American Female',
-    'af_sky': 'American Female',
-    'am_adam': 'American Male',
-    'am_echo': 'American Male',
-    'am_eric': 'American Male',
-    'am_fenrir': 'American Male',
-    'am_liam': 'American Male',
-    'am_michael': 'American Male',
-    'am_onyx': 'American Male',
-    'am_puck': 'American Male',
-    'am_santa': 'American Male',
-    # British English (8 voices)
-    'bf_alice': 'British Female',
-    'bf_emma': 'British Female',
-    'bf_isabella': 'British Female',
-    'bf_lily': 'British Female',
-    'bm_daniel': 'British Male',
-    'bm_fable': 'British Male',
-    'bm_george': 'British Male',
-    'bm_lewis': 'British Male',
-    # Spanish (3 voices)
-    'ef_dora': 'Spanish Female',
-    'em_alex': 'Spanish Male',
-    'em_santa': 'Spanish Male',
-    # French (1 voice)
-    'ff_siwis': 'French Female',
-}
+from kokoro_announce.config import REPO_ID
+from kokoro_announce.local_models import MIN_CONFIG_BYTES, MIN_MODEL_BYTES
+from kokoro_announce.ssl_env import load_ssl_env
+from kokoro_announce.voice_catalog import VOICES
+
+# Concurrent file downloads (kept low to stay under HF per-IP rate limits)
+MAX_DOWNLOAD_WORKERS = 8
+
+
+def configure_ssl():
+    """Handle SSL issues in corporate environments."""
+    import ssl
+    import urllib3
+
+    try:
+        # Disable SSL verification warnings
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        # Try to use system certificates first
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+        # Set environment variables for requests/urllib3
+        os.environ['CURL_CA_BUNDLE'] = ''
+        os.environ['REQUESTS_CA_BUNDLE'] = ''
+
+    except Exception as e:
+        print(f"Warning: SSL configuration failed: {e}")
+        print("Proceeding with default SSL settings...")
+
+
+def enable_hf_transfer():
+    """
+    Use the Rust hf_transfer backend for parallel chunked downloads.
+
+    Must run before huggingface_hub is imported, which reads the setting
+    once. Mostly benefits the ~310 MB model weights.
+
+    Returns:
+        True if hf_transfer is installed and enabled
+    """
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return False
+
+    os.environ.setdefault('HF_HUB_ENABLE_HF_TRANSFER', '1')
+    return True
 
-def safe_download(repo, filename, local_dir, max_retries=3):
-    """Download with SSL bypass and retry logic for corporate environments."""
+
+def safe_download(repo, filenames, local_dir, max_retries=3, etag_timeout=10,
+                  force=False):
+    """
+    Download with SSL bypass and retry logic for corporate environments.
+
+    All files are fetched by a single snapshot_download() call, which makes
+    one repository metadata request and downloads the files concurrently.
+    """
     import time
-    from huggingface_hub.utils import HfHubHTTPError
+    from huggingface_hub import snapshot_download
     
     for attempt in range(max_retries):
         try:
@@ -79,11 +74,14 @@ def safe_download(repo, filename, local_dir, max_retries=3):
                 time.sleep(2)
             
             # Configure download with SSL bypass
-            return hf_hub_download(
-                repo, 
-                filename, 
-                local_dir=local_dir, 
+            return snapshot_download(
+                repo_id=repo,
+                allow_patterns=list(filenames),
+                local_dir=local_dir,
                 local_dir_use_symlinks=False,
+                max_workers=MAX_DOWNLOAD_WORKERS,
+                etag_timeout=etag_timeout,
+                force_download=force,
                 # Add timeout and user agent for better compatibility
                 headers={'User-Agent': 'KTTS72/1.1.0'}
             )
@@ -99,7 +97,7 @@ def safe_download(repo, filename, local_dir, max_retries=3):
                     print("2. Download models manually from: https://huggingface.co/hexgrad/Kokoro-82M")
                     print("3. Contact IT support for SSL certificate issues")
                     print("\nManual download instructions:")
-                    print(f"  - Download {filename} to models/kokoro-82m/ folder")
+                    print(f"  - Download {', '.join(filenames)} to {local_dir}/")
                     raise e
             else:
                 print(f"    Download error: {e}")
@@ -111,8 +109,49 @@ def safe_download(repo, filename, local_dir, max_retries=3):
     return None
 
 
+# Smallest plausible size of each base model file; a smaller file is a
+# truncated download and is fetched again
+BASE_FILE_MIN_BYTES = {
+    'config.json': MIN_CONFIG_BYTES,
+    'kokoro-v1_0.pth': MIN_MODEL_BYTES,
+}
+
+
+def is_downloaded(path, min_bytes=1):
+    """Return True if the file is already present and at least min_bytes long."""
+    try:
+        return path.stat().st_size >= min_bytes
+    except OSError:
+        return False
+
+
+def is_valid_voice_file(path):
+    """
+    Cheap integrity check for a downloaded voice file.
+
+    Voice .pt files are zip archives (torch.save format); is_zipfile() only
+    reads the central directory at the end of the file, so a truncated
+    download is caught without loading the tensor.
+    """
+    return zipfile.is_zipfile(path)
+
+
 def main():
-    voices = list(VOICES.keys())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Download files even if they already exist locally',
+    )
+    args = parser.parse_args()
+
+    # Settings saved by fix_ssl.py (no-op if it was never run)
+    load_ssl_env()
+    configure_ssl()
+    if enable_hf_transfer():
+        print('Using hf_transfer for faster downloads.')
+
+    voices = [name for name, _ in VOICES]
     total = len(voices)
 
     # Download base model
@@ -121,32 +160,62 @@ def main():
     base_dir = Path('models/kokoro-82m')
     base_dir.mkdir(parents=True, exist_ok=True)
 
-    for f in ['config.json', 'kokoro-v1_0.pth']:
-        print(f'  Downloading {f}...')
-        safe_download(repo, f, base_dir)
-        print(f'  OK {f}')
+    base_files = [
+        f for f, min_bytes in BASE_FILE_MIN_BYTES.items()
+        if args.force or not is_downloaded(base_dir / f, min_bytes)
+    ]
+    if base_files:
+        if not args.force:
+            # Missing or truncated; remove partial files so huggingface_hub
+            # doesn't treat them as up to date from its local_dir metadata
+            for f in base_files:
+                (base_dir / f).unlink(missing_ok=True)
+        print(f'  Downloading {", ".join(base_files)}...')
+        # Base model files get a longer metadata timeout (weights are ~310 MB)
+        safe_download(REPO_ID, base_files, base_dir, etag_timeout=30, force=args.force)
+        print('  OK')
+    else:
+        print('  OK (already downloaded)')
 
     # Download voices
     print(f'\n[2/3] Downloading voice files ({total} total)...')
     voices_dir = Path('models')
     voices_dir.mkdir(exist_ok=True)
 
-    for i, v in enumerate(voices):
-        print(f'  [{i+1}/{total}] {v}.pt')
-        safe_download(repo, f'voices/{v}.pt', voices_dir)
+    pending = [
+        f'voices/{v}.pt' for v in voices
+        if args.force or not (
+            is_downloaded(voices_dir / 'voices' / f'{v}.pt')
+            and is_valid_voice_file(voices_dir / 'voices' / f'{v}.pt')
+        )
+    ]
+    if len(pending) < total:
+        print(f'  {total - len(pending)} voices already downloaded')
+
+    if pending:
+        if not args.force:
+            for f in pending:
+                (voices_dir / f).unlink(missing_ok=True)
+        print(f'  Downloading {len(pending)} voice files...')
+        safe_download(REPO_ID, pending, voices_dir, force=args.force)
 
     print('\n[3/3] Verifying downloads...')
-    if Path('models/voices/af_heart.pt').exists():
-        print('[OK] All models downloaded successfully')
-        print(f'\nDownloaded {total} voices:')
-        print(f'  - American English: 20 voices')
-        print(f'  - British English: 8 voices')
-        print(f'  - Spanish: 3 voices')
-        print(f'  - French: 1 voice')
-    else:
-        print('[ERROR] Voice files not found')
+    broken = [
+        v for v in voices
+        if not is_valid_voice_file(voices_dir / 'voices' / f'{v}.pt')
+    ]
+    if broken:
+        print(f'[ERROR] Missing or incomplete voice files: {", ".join(broken)}')
+        print('Run again with --force to re-download them.')
         exit(1)
 
+    print('[OK] All models downloaded successfully')
+    print(f'\nDownloaded {total} voices:')
+    print(f'  - American English: 20 voices')
+    print(f'  - British English: 8 voices')
+    print(f'  - Spanish: 3 voices')
+    print(f'  - French: 1 voice')
+
 
 if __name__ == '__main__':
     main()
@@ -9,6 +9,20 @@ TTS audio files with different voices, languages, and parameters.
 from pathlib import Path
 from kokoro_announce import KokoroAnnouncer, KokoroSettings
 
+# One announcer per pipeline configuration. Loading the model is the expensive
+# part, and it only depends on the language and device; voice, speed and
+# sample rate are passed per call.
+_ANNOUNCER_CACHE: dict[tuple, KokoroAnnouncer] = {}
+
+
+def get_announcer(lang_code: str, device: str | None = None) -> KokoroAnnouncer:
+    """Return a cached announcer for the given language and device."""
+    key = (lang_code, device)
+    if key not in _ANNOUNCER_CACHE:
+        settings = KokoroSettings(lang_code=lang_code, device=device)
+        _ANNOUNCER_CACHE[key] = KokoroAnnouncer(settings)
+    return _ANNOUNCER_CACHE[key]
+
 def main():
     # Output folder - will be created if it doesn't exist
     output_folder = Path("generated_audio")
@@ -29,16 +43,8 @@ def main():
     # Generate each audio file
     for i, task in enumerate(synthesis_tasks, 1):
         try:
-            # Create settings for this task
-            settings = KokoroSettings(
-                voice=task["voice"],
-                lang_code=task["lang"],
-                speed=task["speed"],
-                sample_rate=task["sample_rate"]
-            )
-            
-            # Create announcer with these settings
-            announcer = KokoroAnnouncer(settings)
+            # Reuse the announcer (and its loaded pipeline) for this language
+            announcer = get_announcer(task["lang"])
             
             # Generate output path
             output_path = output_folder / task["filename"]
@@ -48,7 +54,13 @@ def main():
             print(f"[Info] Text: {task['text'][:50]}{'...' if len(task['text']) > 50 else ''}")
             print(f"[Info] Voice: {task['voice']} (lang: {task['lang']}, speed: {task['speed']}, rate: {task['sample_rate']})")
             
-            output_file = announcer.synthesize_to_file(task["text"], str(output_path))
+            output_file = announcer.synthesize_to_file(
+                task["text"],
+                str(output_path),
+                voice=task["voice"],
+                speed=task["speed"],
+                sample_rate=task["sample_rate"],
+            )
             print(f"[Success] Generated: {output_file}")
                 
         except Exception as e:
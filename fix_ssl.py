@@ -6,14 +6,22 @@ This script helps resolve SSL certificate verification issues when downloading
 models from HuggingFace in corporate environments.
 """
 
+import argparse
 import os
 import sys
-import ssl
-import urllib3
-from pathlib import Path
 
-def configure_ssl_bypass():
-    """Configure SSL bypass for the current session."""
+from kokoro_announce.ssl_env import SSL_ENV_PATH, clear_ssl_env, save_ssl_env
+
+def configure_ssl_bypass(persist=True):
+    """
+    Configure SSL bypass for the current session.
+
+    With persist=True the settings are also saved to ~/.kokoro/ssl.env,
+    which app.py and download_models.py load at startup.
+    """
+    import ssl
+    import urllib3
+
     try:
         # Disable SSL verification warnings
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -34,6 +42,10 @@ def configure_ssl_bypass():
         for key, value in ssl_env_vars.items():
             os.environ[key] = value
             print(f"Set {key}={value}")
+
+        if persist:
+            save_ssl_env(ssl_env_vars)
+            print(f"\nSaved to {SSL_ENV_PATH} (applies to future runs)")
             
         print("\n[OK] SSL bypass configured for this session.")
         print("You can now run download_models.py or KTTS72")
@@ -86,16 +98,41 @@ def manual_download_instructions():
     print("    ├── af_heart.pt")
     print("    └── ... (other voice files)")
 
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="KTTS72 SSL Configuration Tool")
+    parser.add_argument('--check', action='store_true',
+                        help='Check current SSL settings')
+    parser.add_argument('--manual', action='store_true',
+                        help='Show manual download instructions')
+    parser.add_argument('--apply-now', action='store_true',
+                        help='Apply the --bypass choice without prompting')
+    parser.add_argument('--bypass', choices=['yes', 'no'], default='yes',
+                        help='With --apply-now: enable (yes) or remove (no) '
+                             'the saved SSL bypass (default: yes)')
+    return parser.parse_args()
+
 def main():
     """Main function to handle SSL configuration."""
-    if len(sys.argv) > 1 and sys.argv[1] == '--check':
+    args = parse_args()
+
+    if args.check:
         check_ssl_status()
         return
     
-    if len(sys.argv) > 1 and sys.argv[1] == '--manual':
+    if args.manual:
         manual_download_instructions()
         return
     
+    if args.apply_now:
+        if args.bypass == 'yes':
+            sys.exit(0 if configure_ssl_bypass() else 1)
+        if clear_ssl_env():
+            print(f"[OK] Removed {SSL_ENV_PATH}; SSL verification restored.")
+        else:
+            print("[OK] No saved SSL bypass to remove.")
+        return
+    
     print("KTTS72 SSL Configuration Tool")
     print("=" * 40)
     print()
@@ -104,7 +141,12 @@ def main():
     print("Common in environments with proxy servers or custom certificates.")
     print()
     
-    choice = input("Configure SSL bypass for this session? (y/n): ").lower().strip()
+    # Never block on input() when run from a script or CI
+    if sys.stdin.isatty():
+        choice = input("Configure SSL bypass for this session? (y/n): ").lower().strip()
+    else:
+        print("Not running interactively; use --apply-now --bypass yes|no.")
+        choice = 'n'
     
     if choice in ['y', 'yes']:
         success = configure_ssl_bypass()
@@ -118,6 +160,7 @@ def main():
         print("\nOther options:")
         print("  python fix_ssl.py --check     # Check current SSL settings") 
         print("  python fix_ssl.py --manual    # Show manual download instructions")
+        print("  python fix_ssl.py --apply-now --bypass yes|no  # Non-interactive")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -19,12 +19,24 @@ Features:
     - Input validation and path security
 """
 
-from .config import KokoroSettings, VoiceInput
-from .pipeline import PipelineFactory
-from .announcer import KokoroAnnouncer, SynthesisResult
-from .validation import ValidationError
-from .audio import write_audio, check_mp3_support
-from .patches import apply_all_patches
+import importlib
+
+# Public names are resolved lazily (PEP 562) so that importing a lightweight
+# submodule such as kokoro_announce.cli does not pull in torch/kokoro.
+_LAZY_EXPORTS = {
+    "KokoroSettings": ".config",
+    "VoiceInput": ".config",
+    "PipelineFactory": ".pipeline",
+    "KokoroAnnouncer": ".announcer",
+    "SynthesisResult": ".announcer",
+    "ValidationError": ".validation",
+    "TypeValidationError": ".validation",
+    "write_audio": ".audio",
+    "write_audio_segments": ".audio",
+    "check_mp3_support": ".audio",
+    "apply_all_patches": ".patches",
+    "AudioCache": ".cache",
+}
 
 __all__ = [
     # Main API
@@ -35,9 +47,26 @@ __all__ = [
     "SynthesisResult",
     # Utilities
     "ValidationError",
+    "TypeValidationError",
     "write_audio",
+    "write_audio_segments",
     "check_mp3_support",
     "apply_all_patches",
+    "AudioCache",
 ]
 
 __version__ = "1.1.0"
+
+
+def __getattr__(name: str):
+    """Import public attributes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,16 +7,18 @@ with support for multiple output formats and secure file handling.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from .audio import write_audio
+from .audio import write_audio_segments, write_wav_stream
+from .cache import AudioCache
 from .config import KokoroSettings, VoiceInput
 from .pipeline import PipelineFactory
-from .local_models import get_voice_path, models_exist
+from .local_models import configure_ssl, get_voice_path, models_exist
 from .validation import (
     ValidationError,
     validate_output_path,
@@ -27,7 +29,27 @@ from .validation import (
 )
 
 
-@dataclass
+# Number of phonemized texts kept per announcer
+_PHONEME_CACHE_SIZE = 512
+
+# Default split pattern, handled with str.split instead of the regex engine
+_NEWLINE_PATTERN = r"\n+"
+
+
+def _split_segments(text: str, split_pattern):
+    """
+    Pre-split text on newlines when using the default split pattern.
+
+    Gives the same segments as re.split(r"\n+", text) for stripped text;
+    KPipeline accepts the resulting list as already-split input. Other
+    patterns are left to the pipeline.
+    """
+    if getattr(split_pattern, "pattern", split_pattern) == _NEWLINE_PATTERN:
+        return [segment for segment in text.split("\n") if segment]
+    return text
+
+
+@dataclass(slots=True, frozen=True)
 class SynthesisResult:
     """Container for synthesized audio and metadata."""
 
@@ -60,35 +82,81 @@ class KokoroAnnouncer:
         """
         self.settings = settings or KokoroSettings()
         self.pipeline_factory = pipeline_factory or PipelineFactory(self.settings)
+        # (lang_code, text, split_pattern) -> [(graphemes, phonemes), ...]
+        self._phoneme_cache: OrderedDict = OrderedDict()
+        self.audio_cache: Optional[AudioCache] = (
+            AudioCache(max_size_mb=self.settings.cache_size_mb)
+            if self.settings.audio_cache
+            else None
+        )
+        # Voice name -> embedding tensor loaded from the local voice file
+        self._voice_cache: dict = {}
+        # Auto-detected device, resolved on first use by _cache_device()
+        self._device: Optional[str] = None
 
     def _resolve_voice(self, voice: Optional[VoiceInput]) -> VoiceInput:
         """
-        Resolve voice input to a valid voice path or name.
+        Resolve voice input to a voice tensor, path or name.
 
         Prefers local bundled voices if available for offline operation.
+        Local voices are loaded once and the tensor is reused, skipping the
+        file checks and torch.load on later calls.
         """
         resolved = voice if voice is not None else self.settings.voice
 
+        if isinstance(resolved, str):
+            cached = self._voice_cache.get(resolved)
+            if cached is not None:
+                return cached
+
         # If voice is a string name and we have local models, use local voice file
         if isinstance(resolved, str) and models_exist():
             # Check if it's just a voice name (not already a path)
             if not Path(resolved).exists():
                 local_voice = get_voice_path(resolved)
                 if Path(local_voice).exists():
-                    return local_voice
+                    tensor = self._load_voice(local_voice)
+                    self._voice_cache[resolved] = tensor
+                    return tensor
+
+        if isinstance(resolved, str) and not resolved.endswith('.pt'):
+            # Not available locally; kokoro will fetch it from HuggingFace
+            configure_ssl()
 
         return resolved
 
-    def synthesize_segments(
+    def _load_voice(self, path: str):
+        """
+        Load a voice embedding tensor.
+
+        The tensor is kept on the CPU: KPipeline only accepts CPU float
+        tensors as voices and moves the embedding to the model device itself.
+        For a CUDA model it is pinned so that per-call copy runs at full
+        PCIe bandwidth without an extra staging copy.
+        """
+        import torch
+
+        tensor = torch.load(path, map_location="cpu", weights_only=True)
+
+        model = getattr(self.pipeline_factory.get(), "model", None)
+        if model is not None and model.device.type == "cuda":
+            tensor = tensor.pin_memory()
+        return tensor
+
+    def iter_segments(
         self,
         text: str,
         *,
         voice: Optional[VoiceInput] = None,
         speed: Optional[float] = None,
         split_pattern=None,
-    ) -> List[SynthesisResult]:
+    ) -> Iterator[SynthesisResult]:
         """
-        Synthesize text and return individual segments.
+        Synthesize text, yielding each segment as soon as it is ready.
+
+        Inputs are validated, and the model and voice loaded, when this is
+        called rather than on the first next(), so errors surface before a
+        caller starts consuming (e.g. opens an output file).
 
         Args:
             text: Text to synthesize
@@ -97,7 +165,7 @@ class KokoroAnnouncer:
             split_pattern: Pattern to split text into segments
 
         Returns:
-            List of SynthesisResult for each text segment
+            Iterator of SynthesisResult, one per text segment
         """
         # Validate inputs
         text = validate_text(text)
@@ -108,23 +176,100 @@ class KokoroAnnouncer:
 
         pipeline = self.pipeline_factory.get()
         split_pattern = split_pattern or self.settings.split_pattern
-        results: List[SynthesisResult] = []
+        voice = self._resolve_voice(voice)
 
+        return self._generate_segments(pipeline, text, voice, speed, split_pattern)
+
+    def _generate_segments(
+        self,
+        pipeline,
+        text: str,
+        voice: VoiceInput,
+        speed: float,
+        split_pattern,
+    ) -> Iterator[SynthesisResult]:
+        """Run validated inputs through the pipeline (see iter_segments)."""
+        # Phonemization is deterministic, so repeated texts skip the G2P
+        # stage and go straight to the model
+        key = (self.settings.lang_code, text, split_pattern)
+        phonemized = self._phoneme_cache.get(key)
+        if phonemized is not None:
+            self._phoneme_cache.move_to_end(key)
+            yield from self._iter_phonemes(pipeline, phonemized, voice, speed)
+            return
+
+        phonemized = []
+
+        # Segments are synthesized one at a time on purpose: KModel only
+        # supports a batch size of 1 (the duration predictor expands each
+        # input by its own predicted lengths), and right-padding phonemes
+        # would change the predicted durations and therefore the audio.
         for graphemes, phonemes, audio in pipeline(
-            text,
-            voice=self._resolve_voice(voice),
+            _split_segments(text, split_pattern),
+            voice=voice,
             speed=speed,
             split_pattern=split_pattern,
         ):
-            results.append(
-                SynthesisResult(
+            phonemized.append((graphemes, phonemes))
+            yield SynthesisResult(
+                graphemes=graphemes,
+                phonemes=phonemes,
+                audio=np.asarray(audio, dtype=np.float32),
+            )
+
+        # Only cache once every segment has been produced
+        self._phoneme_cache[key] = phonemized
+        if len(self._phoneme_cache) > _PHONEME_CACHE_SIZE:
+            self._phoneme_cache.popitem(last=False)
+
+    def synthesize_segments(
+        self,
+        text: str,
+        *,
+        voice: Optional[VoiceInput] = None,
+        speed: Optional[float] = None,
+        split_pattern=None,
+    ) -> List[SynthesisResult]:
+        """
+        Synthesize text and return individual segments.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice override (uses settings if None)
+            speed: Speed override (uses settings if None)
+            split_pattern: Pattern to split text into segments
+
+        Returns:
+            List of SynthesisResult for each text segment
+        """
+        return list(
+            self.iter_segments(
+                text,
+                voice=voice,
+                speed=speed,
+                split_pattern=split_pattern,
+            )
+        )
+
+    def _iter_phonemes(
+        self,
+        pipeline,
+        phonemized: List[Tuple[Sequence[str], Sequence[str]]],
+        voice: VoiceInput,
+        speed: float,
+    ) -> Iterator[SynthesisResult]:
+        """Synthesize previously phonemized segments, skipping G2P."""
+        for graphemes, phonemes in phonemized:
+            for _, _, audio in pipeline.generate_from_tokens(
+                phonemes,
+                voice=voice,
+                speed=speed,
+            ):
+                yield SynthesisResult(
                     graphemes=graphemes,
                     phonemes=phonemes,
                     audio=np.asarray(audio, dtype=np.float32),
                 )
-            )
-
-        return results
 
     def synthesize(
         self,
@@ -156,6 +301,11 @@ class KokoroAnnouncer:
         if not segments:
             return np.zeros(0, dtype=np.float32)
 
+        # Short announcements are usually a single segment; return it as is
+        if len(segments) == 1:
+            return segments[0].audio
+
+        # concatenate() sizes the output once and copies each segment into it
         audio = [seg.audio for seg in segments]
         return np.concatenate(audio, axis=0)
 
@@ -204,18 +354,130 @@ class KokoroAnnouncer:
         if format:
             format = validate_output_format(format)
 
-        # Synthesize audio
-        waveform = self.synthesize(
+        # Serve repeated requests from the audio cache
+        file_format = format or validated_path.suffix.lstrip('.').lower()
+        cache_key = self._audio_cache_key(
+            text, voice, speed, split_pattern, sample_rate, file_format
+        )
+        if cache_key and self.audio_cache.get(cache_key, file_format, validated_path):
+            return validated_path
+
+        # Write each segment as it is synthesized, so memory use stays at
+        # about one segment instead of the whole waveform
+        segments = self.iter_segments(
             text,
             voice=voice,
             speed=speed,
             split_pattern=split_pattern,
         )
-
-        # Write to file with appropriate format
-        return write_audio(
-            waveform,
+        written = write_audio_segments(
+            (seg.audio for seg in segments),
             validated_path,
             sample_rate=sample_rate,
             format=format,
+            wav_subtype=self.settings.wav_subtype,
+        )
+
+        if cache_key:
+            self.audio_cache.put(cache_key, file_format, written)
+
+        return written
+
+    def _audio_cache_key(
+        self,
+        text: str,
+        voice: Optional[VoiceInput],
+        speed: Optional[float],
+        split_pattern,
+        sample_rate: int,
+        format: str,
+    ) -> Optional[str]:
+        """
+        Build the audio cache key for a request.
+
+        Returns:
+            Cache key, or None if caching is disabled or the voice is a
+            tensor (which has no stable identity to key on)
+        """
+        if self.audio_cache is None:
+            return None
+
+        voice = voice if voice is not None else self.settings.voice
+        if not isinstance(voice, (str, Path)):
+            return None
+
+        speed = validate_speed(speed) if speed is not None else self.settings.speed
+        split_pattern = split_pattern or self.settings.split_pattern
+
+        return AudioCache.make_key(
+            validate_text(text),
+            voice,
+            speed,
+            getattr(split_pattern, "pattern", split_pattern),
+            sample_rate,
+            format,
+            self.settings.lang_code,
+            self._cache_device(),
+            self.settings.quantize,
+            self.settings.backend,
+            self.settings.wav_subtype,
+        )
+
+    def _cache_device(self) -> str:
+        """
+        Device the audio is synthesized on, for the cache key.
+
+        Resolved the same way KPipeline does when no device is set, without
+        loading the model, so a cache hit stays cheap.
+        """
+        if self.settings.device:
+            return self.settings.device
+        if self._device is None:
+            import torch
+
+            self._device = "cuda" if torch.cuda.is_available() else "cpu"
+        return self._device
+
+    def synthesize_to_stream(
+        self,
+        text: str,
+        stream: BinaryIO,
+        *,
+        voice: Optional[VoiceInput] = None,
+        speed: Optional[float] = None,
+        split_pattern=None,
+        sample_rate: Optional[int] = None,
+        format: Optional[str] = None,
+    ) -> None:
+        """
+        Synthesize text and write it to a binary stream as WAV.
+
+        Used for piping audio (e.g. to stdout) without a round-trip
+        through a file on disk.
+
+        Args:
+            text: Text to synthesize
+            stream: Writable binary stream (e.g. sys.stdout.buffer)
+            voice: Voice override
+            speed: Speed override
+            split_pattern: Pattern to split text into segments
+            sample_rate: Sample rate override (default: 24000)
+            format: Output format; only 'wav' can be streamed
+
+        Raises:
+            ValidationError: If the format cannot be streamed
+        """
+        sample_rate = sample_rate or self.settings.sample_rate
+        sample_rate = validate_sample_rate(sample_rate)
+
+        if format and validate_output_format(format) != "wav":
+            raise ValidationError("Only WAV output can be streamed")
+
+        waveform = self.synthesize(
+            text,
+            voice=voice,
+            speed=speed,
+            split_pattern=split_pattern,
         )
+
+        write_wav_stream(waveform, stream, sample_rate)
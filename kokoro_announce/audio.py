@@ -3,22 +3,82 @@ Audio output handling for different formats.
 
 Supports:
 - WAV (native, always available)
-- MP3 (requires ffmpeg or pydub with ffmpeg)
+- MP3 (requires lameenc, ffmpeg or pydub with ffmpeg)
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional
 import numpy as np
 import soundfile as sf
+import functools
+import os
+import shutil
 import subprocess
+import sys
 import tempfile
-import os
+import threading
+import wave
+
+from .config import DEFAULT_WAV_SUBTYPE
+
+
+# Below this many samples the numba kernel isn't worth its compile/load cost
+_NUMBA_MIN_SAMPLES = 1 << 20
+_quantize_kernel = None
+
+
+def _get_quantize_kernel():
+    """
+    Compile the fused float32 -> int16 kernel on first use.
+
+    Returns None if numba is not installed. The compiled kernel is cached on
+    disk, except in PyInstaller builds, which have no writable source tree.
+    """
+    global _quantize_kernel
+    if _quantize_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _quantize_kernel = False
+            return None
+
+        # Keep the arithmetic in float32 so the result is bit-identical to
+        # the NumPy path below (the audio cache relies on deterministic
+        # output); a float64 literal would promote the multiply.
+        scale = np.float32(32767.0)
+
+        @numba.njit(cache=not getattr(sys, 'frozen', False))
+        def quantize(audio, out):
+            for i in range(audio.size):
+                v = audio[i] * scale
+                out[i] = max(-scale, min(scale, v))
+
+        _quantize_kernel = quantize
+    return _quantize_kernel or None
+
+
+def _to_int16(audio: np.ndarray) -> np.ndarray:
+    """Convert float audio in [-1, 1] to clipped 16-bit PCM samples."""
+    audio = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+
+    if audio.size >= _NUMBA_MIN_SAMPLES:
+        kernel = _get_quantize_kernel()
+        if kernel is not None:
+            # Scale, clip and cast in a single pass with no temporaries
+            out = np.empty(audio.size, dtype=np.int16)
+            kernel(audio, out)
+            return out
+
+    scaled = audio * 32767.0
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
 
 
 def write_wav(
     audio: np.ndarray,
     path: Path,
     sample_rate: int = 24000,
+    subtype: str = DEFAULT_WAV_SUBTYPE,
 ) -> Path:
     """
     Write audio to WAV file.
@@ -27,15 +87,45 @@ def write_wav(
         audio: Audio waveform as numpy array
         path: Output path
         sample_rate: Sample rate in Hz
+        subtype: soundfile sample format (e.g., 'PCM_16', 'FLOAT')
 
     Returns:
         Path to written file
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    sf.write(str(path), audio, sample_rate)
+    # libsndfile converts float32 to the subtype in C, no Python-side pass
+    sf.write(str(path), audio, sample_rate, subtype=subtype, format='WAV')
     return path
 
 
+def write_wav_stream(
+    audio: np.ndarray,
+    stream: BinaryIO,
+    sample_rate: int = 24000,
+) -> None:
+    """
+    Write audio as 16-bit PCM WAV to a binary stream.
+
+    The header is written with the final length up front, so the stream
+    does not need to be seekable (e.g. stdout connected to a pipe).
+
+    Args:
+        audio: Audio waveform as numpy array
+        stream: Writable binary stream
+        sample_rate: Sample rate in Hz
+    """
+    pcm = _to_int16(audio).astype("<i2", copy=False)
+
+    wav = wave.open(stream, "wb")
+    wav.setnchannels(1)
+    wav.setsampwidth(2)  # 16-bit
+    wav.setframerate(sample_rate)
+    wav.setnframes(len(pcm))
+    wav.writeframes(pcm.tobytes())
+    # Flushes the stream; it stays open since we did not open it
+    wav.close()
+
+
 def write_mp3(
     audio: np.ndarray,
     path: Path,
@@ -45,7 +135,8 @@ def write_mp3(
     """
     Write audio to MP3 file.
 
-    Uses ffmpeg if available, otherwise falls back to pydub.
+    Encodes in-process with lameenc if installed, otherwise uses ffmpeg,
+    then pydub.
 
     Args:
         audio: Audio waveform as numpy array
@@ -61,7 +152,13 @@ def write_mp3(
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Try ffmpeg first (more reliable)
+    # In-process encoding avoids the temp WAV and ffmpeg process startup
+    try:
+        return _write_mp3_lameenc(audio, path, sample_rate, bitrate)
+    except ImportError:
+        pass
+
+    # Try ffmpeg next (more reliable than pydub)
     if _has_ffmpeg():
         return _write_mp3_ffmpeg(audio, path, sample_rate, bitrate)
 
@@ -72,22 +169,45 @@ def write_mp3(
         pass
 
     raise RuntimeError(
-        "MP3 encoding requires ffmpeg. "
-        "Please install ffmpeg and add it to your PATH."
+        "MP3 encoding requires lameenc or ffmpeg. "
+        "Please install lameenc (pip install lameenc) or add ffmpeg to your PATH."
     )
 
 
+def _write_mp3_lameenc(
+    audio: np.ndarray,
+    path: Path,
+    sample_rate: int,
+    bitrate: str,
+) -> Path:
+    """Write MP3 using the in-process LAME encoder (lameenc)."""
+    encoder = _lame_encoder(sample_rate, bitrate)
+    pcm = _to_int16(audio)
+    path.write_bytes(encoder.encode(pcm.tobytes()) + encoder.flush())
+    return path
+
+
+def _lame_encoder(sample_rate: int, bitrate: str):
+    """Create a mono lameenc encoder (raises ImportError if unavailable)."""
+    import lameenc
+
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(int(bitrate.rstrip("k")))
+    encoder.set_in_sample_rate(sample_rate)
+    encoder.set_channels(1)
+    encoder.set_quality(2)  # Same as ffmpeg -q:a 2
+    return encoder
+
+
+@functools.lru_cache(maxsize=1)
 def _has_ffmpeg() -> bool:
-    """Check if ffmpeg is available."""
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except (subprocess.SubprocessError, FileNotFoundError, OSError):
-        return False
+    """
+    Check if ffmpeg is available on PATH.
+
+    The result is cached; call _has_ffmpeg.cache_clear() after installing
+    ffmpeg in a running process.
+    """
+    return shutil.which("ffmpeg") is not None
 
 
 def _write_mp3_ffmpeg(
@@ -142,7 +262,7 @@ def _write_mp3_pydub(
 
     # Convert numpy array to pydub AudioSegment
     # Normalize to 16-bit PCM
-    audio_int16 = (audio * 32767).astype(np.int16)
+    audio_int16 = _to_int16(audio)
 
     segment = AudioSegment(
         audio_int16.tobytes(),
@@ -166,6 +286,7 @@ def write_audio(
     path: Path,
     sample_rate: int = 24000,
     format: Optional[str] = None,
+    wav_subtype: str = DEFAULT_WAV_SUBTYPE,
 ) -> Path:
     """
     Write audio to file in specified format.
@@ -175,6 +296,7 @@ def write_audio(
         path: Output path
         sample_rate: Sample rate in Hz
         format: Output format ('wav' or 'mp3'). If None, inferred from path.
+        wav_subtype: soundfile sample format for WAV output
 
     Returns:
         Path to written file
@@ -187,20 +309,117 @@ def write_audio(
         format = path.suffix.lstrip('.').lower()
 
     if format == 'wav':
-        return write_wav(audio, path, sample_rate)
+        return write_wav(audio, path, sample_rate, wav_subtype)
     elif format == 'mp3':
         return write_mp3(audio, path, sample_rate)
     else:
         raise ValueError(f"Unknown audio format: {format}")
 
 
+def write_audio_segments(
+    segments: Iterable[np.ndarray],
+    path: Path,
+    sample_rate: int = 24000,
+    format: Optional[str] = None,
+    bitrate: str = "192k",
+    wav_subtype: str = DEFAULT_WAV_SUBTYPE,
+) -> Path:
+    """
+    Write audio produced in chunks without concatenating it first.
+
+    WAV is written through a soundfile writer and MP3 through lameenc one
+    segment at a time. The ffmpeg/pydub MP3 fallbacks need the whole
+    waveform, so segments are joined first in that case.
+
+    Args:
+        segments: Audio waveform chunks as numpy arrays
+        path: Output path
+        sample_rate: Sample rate in Hz
+        format: Output format ('wav' or 'mp3'). If None, inferred from path.
+        bitrate: MP3 bitrate (e.g., "128k", "192k", "320k")
+        wav_subtype: soundfile sample format for WAV output
+
+    Returns:
+        Path to written file
+
+    Raises:
+        ValueError: If format is unknown
+        RuntimeError: If format encoding is not available
+    """
+    if format is None:
+        format = path.suffix.lstrip('.').lower()
+
+    if format not in ('wav', 'mp3'):
+        raise ValueError(f"Unknown audio format: {format}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file next to the output and move it into place only
+    # once every segment is written, so a failure mid-synthesis never
+    # leaves a truncated file or clobbers an existing one. The format
+    # extension is kept last for the ffmpeg fallback, which infers it. The
+    # writers create the file themselves so it gets the usual permissions.
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp.{format}"
+    )
+    try:
+        _write_segments(segments, tmp_path, sample_rate, format, bitrate, wav_subtype)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _write_segments(
+    segments: Iterable[np.ndarray],
+    path: Path,
+    sample_rate: int,
+    format: str,
+    bitrate: str,
+    wav_subtype: str,
+) -> None:
+    """Encode segments to path (see write_audio_segments)."""
+    if format == 'wav':
+        with sf.SoundFile(
+            str(path), 'w', samplerate=sample_rate, channels=1,
+            format='WAV', subtype=wav_subtype,
+        ) as wav:
+            for chunk in segments:
+                wav.write(chunk)
+        return
+
+    try:
+        encoder = _lame_encoder(sample_rate, bitrate)
+    except ImportError:
+        chunks = list(segments)
+        audio = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+        write_mp3(audio, path, sample_rate, bitrate)
+        return
+
+    with open(path, 'wb') as mp3:
+        for chunk in segments:
+            pcm = _to_int16(chunk)
+            mp3.write(encoder.encode(pcm.tobytes()))
+        mp3.write(encoder.flush())
+
+
+@functools.lru_cache(maxsize=1)
 def check_mp3_support() -> bool:
     """
     Check if MP3 encoding is supported.
 
+    The result is cached for the life of the process.
+
     Returns:
         True if MP3 can be encoded, False otherwise
     """
+    try:
+        import lameenc
+        return True
+    except ImportError:
+        pass
+
     if _has_ffmpeg():
         return True
 
@@ -0,0 +1,126 @@
+"""
+On-disk cache of synthesized audio files.
+
+Announcement systems replay the same phrases over and over. Output files
+are stored under a hash of everything that affects the audio, so a repeat
+request is served by copying the cached file instead of running the model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from . import __version__
+from .local_models import get_kokoro_version
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "kokoro_announce" / "audio"
+
+
+class AudioCache:
+    """
+    Content-addressed audio file cache with a size cap.
+
+    Least recently used files are evicted once the cache grows past
+    max_size_mb. Cache errors never fail synthesis; they are treated as
+    misses.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_size_mb: int = 256,
+    ) -> None:
+        """
+        Initialize the cache. Nothing is created on disk until a put().
+
+        Args:
+            directory: Cache directory (default: ~/.cache/kokoro_announce/audio)
+            max_size_mb: Maximum total size of cached files in MB
+        """
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.max_size = max_size_mb * 1024 * 1024
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a cache key from the inputs that determine the audio."""
+        data = "|".join(
+            str(part) for part in (__version__, get_kokoro_version(), *parts)
+        )
+        return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: str, format: str) -> Path:
+        return self.directory / f"{key}.{format}"
+
+    def get(self, key: str, format: str, out_path: Path) -> bool:
+        """
+        Copy a cached file to out_path.
+
+        The copy goes to a temp file next to out_path and is renamed into
+        place, so out_path is never left half-written if the copy fails.
+
+        Returns:
+            True on a cache hit, False otherwise
+        """
+        cached = self._path(key, format)
+        try:
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=out_path.parent, prefix=f".{out_path.name}.", suffix=".tmp"
+            )
+            os.close(fd)
+            try:
+                shutil.copyfile(cached, tmp)
+                os.replace(tmp, out_path)
+            except OSError:
+                os.unlink(tmp)
+                raise
+            # Mark as recently used for eviction
+            os.utime(cached)
+        except OSError:
+            return False
+        return True
+
+    def put(self, key: str, format: str, src_path: Path) -> None:
+        """Store a copy of src_path in the cache and evict old entries."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Copy to a temp file first so readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                shutil.copyfile(src_path, tmp)
+                os.replace(tmp, self._path(key, format))
+            except OSError:
+                os.unlink(tmp)
+                raise
+            self._evict()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Delete least recently used files until under the size cap."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        if total <= self.max_size:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_size:
+                break
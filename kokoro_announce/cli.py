@@ -7,27 +7,27 @@ Provides the main CLI functionality including:
 - Text synthesis with various output formats
 """
 
-import argparse
+from __future__ import annotations
+
+import os
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
 from .validation import (
     ValidationError,
-    validate_speed,
-    validate_device,
-    validate_text,
-    validate_sample_rate,
-    validate_output_format,
-    validate_voice_name,
-    validate_lang_code,
-    validate_input_path,
-    validate_output_path,
+    validate_synthesis_args,
     VALID_SAMPLE_RATES,
+    VALID_BACKENDS,
+    VALID_QUANTIZATIONS,
     VALID_OUTPUT_FORMATS,
     MIN_SPEED,
     MAX_SPEED,
 )
+from .voice_catalog import VOICES
+
+if TYPE_CHECKING:
+    import argparse
 
 
 # Voice metadata for listing (English, French, Spanish only)
@@ -41,6 +41,18 @@ VOICE_PREFIXES = {
     'ff': 'French Female',
 }
 
+
+def _group_voices(voices: Iterable[str]) -> Dict[str, List[str]]:
+    """Group voice names by their two-letter prefix, ordered by prefix."""
+    groups: Dict[str, List[str]] = {}
+    for voice in voices:
+        groups.setdefault(voice[:2], []).append(voice)
+    return dict(sorted(groups.items()))
+
+
+# Catalog voices grouped once at import for --list-voices
+_GROUPED_VOICES = _group_voices(name for name, _ in VOICES)
+
 # Supported languages (English, French, Spanish)
 LANGUAGES = {
     'a': 'American English',
@@ -49,6 +61,9 @@ LANGUAGES = {
     'f': 'French',
 }
 
+# --out value that streams WAV audio to stdout instead of a file
+STDOUT_PATH = '-'
+
 
 def create_parser() -> argparse.ArgumentParser:
     """
@@ -57,6 +72,9 @@ def create_parser() -> argparse.ArgumentParser:
     Returns:
         Configured ArgumentParser
     """
+    # Imported here so list commands, which bypass the parser, don't pay for it
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="KTTS72",
         description="Kokoro TTS - High-quality offline text-to-speech synthesis",
@@ -89,7 +107,7 @@ Examples:
         "--out", "-o",
         type=Path,
         default=Path("output.wav"),
-        help="Output file path (default: output.wav)",
+        help="Output file path, or - to write WAV to stdout (default: output.wav)",
     )
     parser.add_argument(
         "--format",
@@ -128,6 +146,25 @@ Examples:
         default=None,
         help="PyTorch device: cpu, cuda, mps (default: auto)",
     )
+    parser.add_argument(
+        "--backend",
+        default="eager",
+        choices=sorted(VALID_BACKENDS),
+        help="Inference backend; tensorrt and cudagraphs need CUDA, "
+             "onnx needs onnxruntime (default: eager)",
+    )
+    parser.add_argument(
+        "--quantize",
+        default=None,
+        choices=sorted(VALID_QUANTIZATIONS),
+        help="Quantize model weights for faster CPU inference (default: off)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always synthesize, ignoring previously cached audio",
+    )
 
     # List commands
     parser.add_argument(
@@ -135,6 +172,11 @@ Examples:
         action="store_true",
         help="List all available voices",
     )
+    parser.add_argument(
+        "--from-disk",
+        action="store_true",
+        help="With --list-voices, list installed voice files instead of the catalog",
+    )
     parser.add_argument(
         "--list-languages",
         action="store_true",
@@ -151,43 +193,55 @@ Examples:
     return parser
 
 
+# Base path for bundled resources (PyInstaller bundle or project root)
+if getattr(sys, 'frozen', False):
+    _BASE_PATH = Path(sys._MEIPASS)
+else:
+    _BASE_PATH = Path(__file__).parent.parent
+
+_VOICES_DIR = _BASE_PATH / 'models' / 'voices'
+
+
 def get_base_path() -> Path:
     """Get the base path for bundled resources."""
-    if getattr(sys, 'frozen', False):
-        return Path(sys._MEIPASS)
-    else:
-        return Path(__file__).parent.parent
+    return _BASE_PATH
 
 
-def list_voices() -> None:
-    """List all available voices grouped by type."""
-    base_path = get_base_path()
-    voices_dir = base_path / 'models' / 'voices'
+def list_voices(from_disk: bool = False) -> None:
+    """
+    List voices grouped by type.
 
+    Args:
+        from_disk: List the installed voice files instead of the catalog
+    """
     print("\nAvailable Voices:")
     print("=" * 60)
 
-    if voices_dir.exists():
-        voices = sorted([f.stem for f in voices_dir.glob('*.pt')])
-        if voices:
-            # Group by prefix
+    if from_disk:
+        voices_dir = _VOICES_DIR
+        try:
+            # scandir avoids building a Path and running fnmatch per entry
+            with os.scandir(voices_dir) as entries:
+                names = sorted(
+                    e.name[:-3] for e in entries
+                    if e.name.endswith('.pt') and e.is_file()
+                )
+        except FileNotFoundError:
             groups = {}
-            for voice in voices:
-                prefix = voice[:2]
-                if prefix not in groups:
-                    groups[prefix] = []
-                groups[prefix].append(voice)
-
-            for prefix in sorted(groups.keys()):
-                group_name = VOICE_PREFIXES.get(prefix, prefix.upper())
-                print(f"\n{group_name}:")
-                for voice in groups[prefix]:
-                    print(f"  - {voice}")
+            print(f"Voices directory not found: {voices_dir}")
+            print("Run setup_env.bat to download models.")
         else:
-            print("No voices found!")
+            groups = _group_voices(names)
+            if not groups:
+                print("No voices found!")
     else:
-        print(f"Voices directory not found: {voices_dir}")
-        print("Run setup_env.bat to download models.")
+        groups = _GROUPED_VOICES
+
+    for prefix, voices in groups.items():
+        group_name = VOICE_PREFIXES.get(prefix, prefix.upper())
+        print(f"\n{group_name}:")
+        for voice in voices:
+            print(f"  - {voice}")
 
     print("\n" + "=" * 60)
 
@@ -218,37 +272,36 @@ def validate_args(args: argparse.Namespace) -> Tuple[str, Path]:
     Raises:
         ValidationError: If any argument is invalid
     """
-    # Validate voice and language
-    validate_voice_name(args.voice)
-    validate_lang_code(args.lang)
-    validate_speed(args.speed)
-    validate_device(args.device)
-    validate_sample_rate(args.sample_rate)
-
-    # Validate format if specified
-    if args.format:
-        validate_output_format(args.format)
-
-    # Get and validate text
-    if args.text:
-        text = validate_text(args.text)
-    elif args.text_file:
-        input_path = validate_input_path(args.text_file, "Text file")
-        try:
-            raw_text = input_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError as e:
-            raise ValidationError(f"Text file is not valid UTF-8: {e}")
-        text = validate_text(raw_text)
-    else:
+    if not args.text and not args.text_file:
         raise ValidationError(
             "Either --text or --text-file is required "
             "(unless using --list-voices or --list-languages)"
         )
 
-    # Validate output path
-    output_path = validate_output_path(args.out, "Output file")
+    # '-' streams WAV to stdout, no file is written
+    to_stdout = writes_to_stdout(args)
+    if to_stdout and args.format == 'mp3':
+        raise ValidationError("MP3 output cannot be written to stdout")
+
+    values = validate_synthesis_args(
+        text=args.text or None,
+        speed=args.speed,
+        device=args.device,
+        voice=args.voice,
+        lang=args.lang,
+        sample_rate=args.sample_rate,
+        fmt=args.format or None,
+        input_path=args.text_file,
+        output_path=None if to_stdout else args.out,
+    )
+
+    output_path = args.out if to_stdout else values['output_path']
+    return values['text'], output_path
+
 
-    return text, output_path
+def writes_to_stdout(args: argparse.Namespace) -> bool:
+    """Return True if audio should be streamed to stdout (--out -)."""
+    return str(args.out) == STDOUT_PATH
 
 
 def get_output_format(args: argparse.Namespace) -> str:
@@ -10,24 +10,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import re
-from typing import Optional, Pattern, Union
+from typing import TYPE_CHECKING, Optional, Pattern, Union
 
-try:
+# torch is only needed for the type alias; importing it here would make
+# every `from kokoro_announce import KokoroSettings` pay torch's import time
+if TYPE_CHECKING:
     import torch
-    TorchTensor = torch.Tensor
-except Exception:
-    TorchTensor = object
 
 
 # Type alias for voice inputs
-VoiceInput = Union[str, Path, TorchTensor]
+VoiceInput = Union[str, Path, "torch.Tensor"]
 
 
+# HuggingFace repository the model and voices come from
+REPO_ID = "hexgrad/Kokoro-82M"
+
 # Default constants
 DEFAULT_SAMPLE_RATE = 24000
 DEFAULT_SPEED = 1.0
 DEFAULT_LANG_CODE = "a"
 DEFAULT_VOICE = "af_heart"
+DEFAULT_BACKEND = "eager"
+DEFAULT_CACHE_SIZE_MB = 256
+# 16-bit PCM: half the size of float WAV and playable everywhere
+DEFAULT_WAV_SUBTYPE = "PCM_16"
 
 
 @dataclass
@@ -45,12 +51,35 @@ class KokoroSettings:
         speed: Playback speed multiplier (0.25 to 4.0)
         split_pattern: Regex to split long text into segments
         sample_rate: Output audio sample rate in Hz
+        wav_subtype: WAV sample format ('PCM_16', or e.g. 'FLOAT' for
+            32-bit float files)
         device: PyTorch device ('cpu', 'cuda', 'mps', or None for auto)
+        backend: Inference backend for the model:
+            - 'eager': Plain PyTorch
+            - 'tensorrt': Compile with Torch-TensorRT (CUDA only)
+            - 'cudagraphs': Replay captured CUDA graphs (CUDA only)
+            - 'onnx': Export to ONNX and run with ONNX Runtime
+        quantize: Weight quantization for CPU inference ('int8' or None)
+        audio_cache: Reuse previously synthesized files for identical
+            requests (stored under ~/.cache/kokoro_announce/audio). Off by
+            default for library use; the CLI turns it on unless --no-cache
+            is given
+        cache_size_mb: Maximum size of the audio cache in MB
     """
 
     lang_code: str = DEFAULT_LANG_CODE
     voice: Optional[VoiceInput] = DEFAULT_VOICE
     speed: float = DEFAULT_SPEED
-    split_pattern: Pattern[str] = re.compile(r"\n+")
+    split_pattern: Union[str, Pattern[str]] = re.compile(r"\n+")
     sample_rate: int = DEFAULT_SAMPLE_RATE
+    wav_subtype: str = DEFAULT_WAV_SUBTYPE
     device: Optional[str] = None
+    backend: str = DEFAULT_BACKEND
+    quantize: Optional[str] = None
+    audio_cache: bool = False
+    cache_size_mb: int = DEFAULT_CACHE_SIZE_MB
+
+    def __post_init__(self) -> None:
+        # Compile string patterns once instead of on every synthesis call
+        if isinstance(self.split_pattern, str):
+            self.split_pattern = re.compile(self.split_pattern)
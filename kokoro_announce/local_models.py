@@ -6,23 +6,46 @@ downloading from HuggingFace. Works with both development and PyInstaller builds
 Automatically downloads models if they don't exist locally.
 """
 
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
 import sys
 import os
-import ssl
-import urllib3
-
-# Handle SSL issues in corporate environments
-try:
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    os.environ['CURL_CA_BUNDLE'] = ''
-    os.environ['REQUESTS_CA_BUNDLE'] = ''
-except Exception:
-    pass  # Continue with default SSL settings
+import shutil
 
+from .config import REPO_ID
+
+_ssl_configured = False
+
+
+def configure_ssl() -> None:
+    """
+    Handle SSL issues in corporate environments.
+
+    Runs once, before the first HuggingFace request. Deferred from import
+    time so that runs with local models never import urllib3.
+    """
+    global _ssl_configured
+    if _ssl_configured:
+        return
+    _ssl_configured = True
+
+    try:
+        import ssl
+        import urllib3
+
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        os.environ['CURL_CA_BUNDLE'] = ''
+        os.environ['REQUESTS_CA_BUNDLE'] = ''
+    except Exception:
+        pass  # Continue with default SSL settings
+
+@lru_cache(maxsize=1)
 def get_models_dir() -> Path:
     """
     Get the models directory path.
@@ -43,23 +66,43 @@ def get_models_dir() -> Path:
 
     return base_path / 'models'
 
-def get_model_paths() -> dict:
+@lru_cache(maxsize=1)
+def get_model_paths() -> Mapping[str, str]:
     """
     Get paths to all bundled model files.
 
+    The paths are fixed for the life of the process, so they are computed
+    once and returned as a read-only mapping.
+
     Returns:
-        Dict with keys: 'config', 'model', 'voice_dir'
+        Mapping with keys: 'config', 'model', 'voice_dir', 'models_dir'
     """
     models_dir = get_models_dir()
     kokoro_dir = models_dir / 'kokoro-82m'
     voices_dir = models_dir / 'voices'
 
-    return {
+    return MappingProxyType({
         'config': str(kokoro_dir / 'config.json'),
         'model': str(kokoro_dir / 'kokoro-v1_0.pth'),
         'voice_dir': str(voices_dir),
         'models_dir': str(models_dir),
-    }
+    })
+
+@lru_cache(maxsize=1)
+def get_kokoro_version() -> str:
+    """
+    Get the installed kokoro version.
+
+    Caches derived from the model (synthesized audio, ONNX exports) key on
+    it, since a new kokoro release can change the output.
+
+    Returns:
+        Version string, or 'unknown' if kokoro isn't installed
+    """
+    try:
+        return metadata.version('kokoro')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
 
 def get_voice_path(voice_name: str) -> str:
     """
@@ -71,14 +114,44 @@ def get_voice_path(voice_name: str) -> str:
     Returns:
         Path to the voice file
     """
-    paths = get_model_paths()
-    voice_dir = Path(paths['voice_dir'])
-
     # Add .pt extension if not present
     if not voice_name.endswith('.pt'):
-        voice_name = f"{voice_name}.pt"
+        voice_name = voice_name + '.pt'
+
+    # Plain string join: this runs per synthesis call
+    return os.path.join(get_model_paths()['voice_dir'], voice_name)
+
+# Size floors for the model files. The weights are ~310 MB, so anything much
+# smaller is a truncated download that would only fail later in torch.load.
+MIN_MODEL_BYTES = 300 * 1024 * 1024
+MIN_CONFIG_BYTES = 1000
+
+# Written to the models directory once a full check has passed, with the
+# model file sizes. Later processes read it and stat only the weights file
+# instead of listing directories. Bump the suffix if the check changes.
+VERIFIED_SENTINEL = '.kokoro_verified_v1'
+
+# Set once the model files have been found; they don't go away mid-process.
+_models_exist_cache: Optional[bool] = None
+# Directory mtimes seen by the last failed check. Adding a file changes its
+# directory's mtime, so an unchanged stamp means the files are still missing.
+_models_missing_stamp: Optional[tuple] = None
+
+
+def _invalidate_models_cache() -> None:
+    """Forget the cached models_exist() result."""
+    global _models_exist_cache, _models_missing_stamp
+    _models_exist_cache = None
+    _models_missing_stamp = None
+
+
+def _dir_mtime(directory: str) -> Optional[int]:
+    """Return a directory's mtime in ns, or None if it doesn't exist."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
 
-    return str(voice_dir / voice_name)
 
 def models_exist() -> bool:
     """
@@ -87,20 +160,126 @@ def models_exist() -> bool:
     Returns:
         True if all models are present, False otherwise
     """
+    global _models_exist_cache, _models_missing_stamp
+    if _models_exist_cache:
+        return True
+
     paths = get_model_paths()
+    config_path = Path(paths['config'])
+    model_path = Path(paths['model'])
+    sentinel_path = os.path.join(paths['models_dir'], VERIFIED_SENTINEL)
+
+    if _read_sentinel(sentinel_path, config_path.name, str(model_path)):
+        _models_exist_cache = True
+        return True
+
+    # Repeated polls while models are missing cost two stats, not listings
+    stamp = (
+        _dir_mtime(str(config_path.parent)),
+        _dir_mtime(paths['voice_dir']),
+    )
+    if stamp == _models_missing_stamp:
+        return False
+
+    # One directory listing per folder instead of a stat per file
+    kokoro_files = _list_dir(config_path.parent)
+    if (
+        not _has_min_size(kokoro_files.get(config_path.name), MIN_CONFIG_BYTES)
+        or not _has_min_size(kokoro_files.get(model_path.name), MIN_MODEL_BYTES)
+        or 'af_heart.pt' not in _list_dir(Path(paths['voice_dir']))
+    ):
+        _models_missing_stamp = stamp
+        return False
+
+    _write_sentinel(sentinel_path, {
+        config_path.name: kokoro_files[config_path.name].stat().st_size,
+        model_path.name: kokoro_files[model_path.name].stat().st_size,
+    })
+    _models_exist_cache = True
+    return True
+
+
+def _read_sentinel(path: str, config_name: str, model_path: str) -> bool:
+    """
+    Return True if the sentinel records complete model files and the
+    weights file is still there with the recorded size.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            sizes = dict(line.split() for line in f if line.strip())
+        model_size = int(sizes[os.path.basename(model_path)])
+        return (
+            int(sizes[config_name]) >= MIN_CONFIG_BYTES
+            and model_size >= MIN_MODEL_BYTES
+            and os.stat(model_path).st_size == model_size
+        )
+    except (OSError, ValueError, KeyError):
+        # Missing, unreadable, stale or from an older format: do the full
+        # check, which rewrites the sentinel if the models are complete
+        return False
+
+
+def _write_sentinel(path: str, sizes: Mapping[str, int]) -> None:
+    """Record verified model file sizes (best effort; dir may be read-only)."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{name} {size}\n" for name, size in sizes.items())
+    except OSError:
+        pass
 
-    required_files = [
-        paths['config'],
-        paths['model'],
-        get_voice_path('af_heart'),
-    ]
 
-    return all(Path(p).exists() for p in required_files)
+def _list_dir(directory: Path) -> dict:
+    """Return a directory's entries by name (empty if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _has_min_size(entry: Optional[os.DirEntry], min_bytes: int) -> bool:
+    """Return True if entry is a file of at least min_bytes."""
+    if entry is None:
+        return False
+    try:
+        # DirEntry caches the stat; on Windows it comes from the listing itself
+        return entry.is_file() and entry.stat().st_size >= min_bytes
+    except OSError:
+        return False
+
+def _set_hf_transfer(enabled: bool) -> bool:
+    """
+    Turn the Rust hf_transfer download backend on or off.
+
+    huggingface_hub reads HF_HUB_ENABLE_HF_TRANSFER once at import, and it
+    is usually already imported by kokoro by the time models are fetched,
+    so the parsed constant is updated as well as the environment. This
+    changes process-wide state: call it only while no downloads are running.
+
+    Returns:
+        True if hf_transfer is now enabled
+    """
+    if enabled:
+        # Respect an explicit opt-out
+        if os.environ.get('HF_HUB_ENABLE_HF_TRANSFER', '1') not in ('1', 'true', 'True'):
+            return False
+        try:
+            import hf_transfer  # noqa: F401
+        except ImportError:
+            return False
+
+    os.environ['HF_HUB_ENABLE_HF_TRANSFER'] = '1' if enabled else '0'
+    from huggingface_hub import constants
+    constants.HF_HUB_ENABLE_HF_TRANSFER = enabled
+    return enabled
+
 
 def safe_hf_download(repo_id, filename, max_retries=3):
     """Download with SSL bypass and retry logic."""
     import time
     from huggingface_hub import hf_hub_download
+
+    configure_ssl()
     
     for attempt in range(max_retries):
         try:
@@ -128,6 +307,71 @@ def safe_hf_download(repo_id, filename, max_retries=3):
     return None
 
 
+def _link_or_copy(src, dest: Path) -> None:
+    """
+    Place a downloaded file from the HuggingFace cache at dest.
+
+    Hard-links when the cache is on the same filesystem, so the ~310 MB
+    weights aren't read and written again. Otherwise falls back to
+    shutil.copyfile, which uses kernel-side copying (sendfile) where the
+    platform supports it.
+    """
+    try:
+        if os.path.samefile(src, dest):
+            return  # Already linked to this blob
+    except OSError:
+        pass  # dest doesn't exist yet
+
+    # Build the file under a temp name and swap it in, so an existing dest
+    # (e.g. from an earlier or partial download) is replaced rather than
+    # making os.link fail
+    tmp = dest.with_name(dest.name + '.tmp')
+    try:
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(src, tmp)
+        except OSError:
+            # Cross-device or unsupported filesystem
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _fetch_files(repo_id, files) -> list:
+    """
+    Download files concurrently and place them in their directories.
+
+    Files are independent, so total time is roughly that of the largest
+    one (the ~310 MB weights).
+
+    Returns:
+        (filename, dest_dir, exception) for each file that failed
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        futures = {}
+        for filename, dest_dir in files:
+            print(f"Downloading {filename}...")
+            future = executor.submit(safe_hf_download, repo_id, filename)
+            futures[future] = (filename, dest_dir)
+
+        for future in as_completed(futures):
+            filename, dest_dir = futures[future]
+            try:
+                cached_path = future.result()
+                dest_path = dest_dir / Path(filename).name
+                _link_or_copy(cached_path, dest_path)
+            except Exception as e:
+                failed.append((filename, dest_dir, e))
+                continue
+            print(f"  Saved to {dest_path}")
+    return failed
+
+
 def download_models() -> bool:
     """
     Download models to local directory if they don't exist.
@@ -139,8 +383,6 @@ def download_models() -> bool:
         return True
 
     try:
-        import shutil
-
         print("[SETUP] Downloading models to local directory...")
         print("This will download ~313 MB of model files...")
 
@@ -152,21 +394,33 @@ def download_models() -> bool:
         kokoro_dir.mkdir(parents=True, exist_ok=True)
         voices_dir.mkdir(parents=True, exist_ok=True)
 
-        repo_id = 'hexgrad/Kokoro-82M'
+        repo_id = REPO_ID
         files_to_download = [
             ('config.json', kokoro_dir),
             ('kokoro-v1_0.pth', kokoro_dir),
             ('voices/af_heart.pt', voices_dir),
         ]
 
-        for filename, dest_dir in files_to_download:
-            print(f"Downloading {filename}...")
-            cached_path = safe_hf_download(repo_id, filename)
-            local_filename = Path(filename).name
-            dest_path = dest_dir / local_filename
-            shutil.copy2(cached_path, dest_path)
-            print(f"  Saved to {dest_path}")
+        # Parallel byte-range downloads; hf_transfer shows no progress bar.
+        # Decided once here: huggingface_hub reads it from module globals,
+        # which must not change while the download threads are running.
+        use_hf_transfer = _set_hf_transfer(True)
+        if use_hf_transfer:
+            print("Using hf_transfer")
+
+        failed = _fetch_files(repo_id, files_to_download)
+        if failed and use_hf_transfer:
+            # Retry with the regular downloader rather than failing
+            names = ', '.join(filename for filename, _, _ in failed)
+            print(f"hf_transfer failed for {names}, using standard download")
+            _set_hf_transfer(False)
+            failed = _fetch_files(
+                repo_id, [(filename, dest_dir) for filename, dest_dir, _ in failed]
+            )
+        if failed:
+            raise failed[0][2]
 
+        _invalidate_models_cache()
         print("[OK] Models downloaded successfully!")
         return True
 
@@ -190,23 +444,26 @@ def get_model_info() -> dict:
 
         if name == 'voice_dir':
             # List all voices
-            voice_dir = Path(path)
-            if voice_dir.exists():
-                voices = [f.stem for f in voice_dir.glob('*.pt')]
+            try:
+                with os.scandir(path) as it:
+                    voices = [e.name[:-3] for e in it if e.name.endswith('.pt')]
+            except FileNotFoundError:
+                pass
+            else:
                 info['available_voices'] = voices
         else:
-            filepath = Path(path)
-            if filepath.exists():
-                size_mb = filepath.stat().st_size / (1024 * 1024)
+            try:
+                size_mb = os.stat(path).st_size / (1024 * 1024)
+            except FileNotFoundError:
                 info[name] = {
-                    'path': str(filepath),
-                    'size_mb': round(size_mb, 2),
-                    'exists': True,
+                    'path': str(path),
+                    'exists': False,
                 }
             else:
                 info[name] = {
-                    'path': str(filepath),
-                    'exists': False,
+                    'path': str(path),
+                    'size_mb': round(size_mb, 2),
+                    'exists': True,
                 }
 
     return info
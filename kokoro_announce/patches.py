@@ -11,60 +11,19 @@ Patches are designed to be:
 - Documented: Explain why each patch exists
 """
 
+import importlib.machinery
 import os
 import sys
-import subprocess
+import types
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-# Store original sys.argv BEFORE any imports can modify it
-_original_argv = sys.argv.copy()
-
-
-def protect_argv() -> bool:
-    """
-    Protect sys.argv from being corrupted by subprocess calls.
-
-    spaCy's weasel library runs pip commands that corrupt sys.argv,
-    causing argparse to see pip arguments instead of user arguments.
-
-    This patch:
-    1. Blocks pip install commands from running (they fail in frozen envs anyway)
-    2. Restores sys.argv after any subprocess call
-
-    Returns:
-        True if patch was applied
-    """
-    global _original_argv
-    _original_run = subprocess.run
-
-    def _patched_run(*args, **kwargs):
-        global _original_argv
-
-        # Block pip install commands from spaCy/weasel
-        if args and len(args) > 0:
-            cmd = args[0] if isinstance(args[0], list) else str(args[0])
-            cmd_str = str(cmd).lower()
-
-            # Block pip install attempts
-            if 'pip' in cmd_str and 'install' in cmd_str:
-                # Return fake successful result
-                class FakeResult:
-                    returncode = 0
-                    stdout = b''
-                    stderr = b''
-                return FakeResult()
-
-        # Run the actual command
-        result = _original_run(*args, **kwargs)
-
-        # Restore argv after subprocess (some libs corrupt it)
-        sys.argv = _original_argv
-
-        return result
-
-    subprocess.run = _patched_run
-    return True
+# Patch state, so repeated calls (e.g. from several entry points in one
+# process) don't re-apply anything
+_patch_results: Optional[dict] = None
+_espeak_configured = False
+_spacy_patched = False
 
 
 def configure_espeak() -> bool:
@@ -78,6 +37,10 @@ def configure_espeak() -> bool:
     Returns:
         True if espeak was configured, False otherwise
     """
+    global _espeak_configured
+    if _espeak_configured:
+        return True
+
     try:
         # Determine base path (PyInstaller bundle or development)
         if getattr(sys, 'frozen', False):
@@ -103,6 +66,7 @@ def configure_espeak() -> bool:
 
             os.environ['PHONEMIZER_ESPEAK_LIBRARY'] = dll_path
             os.environ['ESPEAK_DATA_PATH'] = data_path
+            _espeak_configured = True
             return True
 
         except ImportError:
@@ -114,24 +78,152 @@ def configure_espeak() -> bool:
         return False
 
 
+class MinimalToken:
+    """Minimal token that satisfies misaki's requirements."""
+    __slots__ = ('text', 'text_with_ws', 'whitespace_', 'tag_', 'pos_', 'lemma_')
+
+    def __init__(self, text: str, has_space: bool = True):
+        self.text = text
+        self.text_with_ws = text + (" " if has_space else "")
+        self.whitespace_ = " " if has_space else ""
+        self.tag_ = "NN"
+        self.pos_ = "NOUN"
+        self.lemma_ = text.lower()
+
+
+# Tokens are read-only once built, so identical words share one instance.
+# lru_cache keeps the bounded LRU safe when several threads tokenize at once.
+@lru_cache(maxsize=10_000)
+def _get_token(text: str, has_space: bool) -> MinimalToken:
+    """Return a shared MinimalToken for the word, creating it if needed."""
+    return MinimalToken(text, has_space)
+
+
+class MinimalTokenizer:
+    """Simple whitespace tokenizer."""
+    def __call__(self, text: str):
+        words = text.split()
+        last = len(words) - 1
+        return [_get_token(word, i < last) for i, word in enumerate(words)]
+
+
+class MinimalModel:
+    """Minimal spaCy model compatible with misaki."""
+    def __init__(self):
+        self.tokenizer = MinimalTokenizer()
+
+    def __call__(self, text: str):
+        return self.tokenizer(text)
+
+
+_minimal_model: Optional[MinimalModel] = None
+
+
+class MinimalRagged:
+    """The parts of thinc's Ragged that misaki reads: data and lengths."""
+    __slots__ = ('data', 'lengths')
+
+    def __init__(self, data, lengths):
+        self.data = data
+        self.lengths = lengths
+
+
+class MinimalAlignment:
+    """
+    Stand-in for spacy.training.Alignment.
+
+    misaki uses Alignment.from_strings() to map its own tokens (x) onto
+    the tokenizer's tokens (y) when the text contains link or stress
+    markup such as ``[word](/phəˈnimz/)`` or ``[word](+1)``.
+    """
+    __slots__ = ('x2y', 'y2x')
+
+    def __init__(self, x2y: MinimalRagged, y2x: MinimalRagged):
+        self.x2y = x2y
+        self.y2x = y2x
+
+    @classmethod
+    def from_strings(cls, A, B) -> "MinimalAlignment":
+        """
+        Align two tokenizations of the same text.
+
+        Like spaCy, tokens are matched by character offsets with whitespace
+        removed and case ignored; a token maps to every token on the other
+        side whose characters overlap it.
+        """
+        import numpy as np
+
+        if _squash(A) != _squash(B):
+            raise ValueError(
+                f"Cannot align tokenizations with different text: {A} vs {B}"
+            )
+        owners_a = _char_owners(A)
+        owners_b = _char_owners(B)
+        return cls(
+            x2y=_ragged(np, owners_a, owners_b, len(A)),
+            y2x=_ragged(np, owners_b, owners_a, len(B)),
+        )
+
+
+def _squash(tokens) -> str:
+    """Tokens joined with whitespace removed and case folded."""
+    return ''.join(''.join(token.split()) for token in tokens).lower()
+
+
+def _char_owners(tokens) -> List[int]:
+    """Token index of each non-whitespace character in tokens."""
+    return [
+        i for i, token in enumerate(tokens)
+        for char in token if not char.isspace()
+    ]
+
+
+def _ragged(np, src_owners: List[int], dst_owners: List[int], n_src: int) -> MinimalRagged:
+    """For each source token, the sorted destination tokens it overlaps."""
+    targets: List[List[int]] = [[] for _ in range(n_src)]
+    for src, dst in zip(src_owners, dst_owners):
+        row = targets[src]
+        if not row or row[-1] != dst:
+            row.append(dst)
+    return MinimalRagged(
+        data=np.array([dst for row in targets for dst in row], dtype=np.int32),
+        lengths=np.array([len(row) for row in targets], dtype=np.int32),
+    )
+
+
 def patch_spacy_load() -> bool:
     """
-    Patch spacy.load() to avoid loading en_core_web_sm model.
+    Provide a minimal spaCy model instead of en_core_web_sm.
 
     The misaki (g2p) library tries to load spaCy's en_core_web_sm model
     for tokenization, but it doesn't actually need the full NLP pipeline.
     We provide a minimal fake model that satisfies the tokenization needs.
 
+    If spaCy has not been imported yet, a stub ``spacy`` module is
+    registered in sys.modules so the real package (and thinc, srsly,
+    catalogue, ...) is never imported. If it is already loaded,
+    spacy.load() is wrapped instead.
+
     This avoids:
+    - Importing spaCy and its dependencies at startup
     - Downloading 11MB+ model files
-    - spaCy's pip install attempts in frozen environments
+    - spaCy's pip install attempts (which also corrupt sys.argv)
     - Import errors when the model isn't installed
 
     Returns:
         True if patch was applied, False otherwise
     """
+    global _spacy_patched
+    if _spacy_patched:
+        return True
+
     try:
-        import spacy
+        if 'spacy' not in sys.modules:
+            _install_spacy_stub()
+            _spacy_patched = True
+            return True
+
+        spacy = sys.modules['spacy']
         _original_load = spacy.load
 
         def _patched_load(name, **kwargs):
@@ -141,51 +233,86 @@ def patch_spacy_load() -> bool:
             return _original_load(name, **kwargs)
 
         spacy.load = _patched_load
+
+        # misaki calls spacy.cli.download() when the model isn't installed,
+        # which would pip install it in a subprocess
+        spacy.cli.download = lambda *args, **kwargs: None
+        _spacy_patched = True
         return True
 
-    except ImportError:
-        # spaCy not installed
-        return False
     except Exception:
         return False
 
 
+def _install_spacy_stub() -> None:
+    """
+    Register a stub ``spacy`` package exposing only what misaki uses.
+
+    misaki checks ``spacy.util.is_package()``, may call
+    ``spacy.cli.download()`` and then ``spacy.load()``, and uses
+    ``spacy.training.Alignment`` for link/stress markup.
+    """
+    def _load(name, **kwargs):
+        if 'en_core_web' in str(name):
+            return _create_minimal_tokenizer()
+        raise OSError(f"Can't find model '{name}' (spaCy is stubbed out)")
+
+    def _blank(name, **kwargs):
+        return _create_minimal_tokenizer()
+
+    def _is_package(name) -> bool:
+        return 'en_core_web' in str(name)
+
+    def _download(*args, **kwargs) -> None:
+        return None
+
+    spacy = _new_stub_module('spacy', is_package=True)
+    spacy.load = _load
+    spacy.blank = _blank
+
+    util = _new_stub_module('spacy.util')
+    util.is_package = _is_package
+
+    cli = _new_stub_module('spacy.cli')
+    cli.download = _download
+
+    tokens = _new_stub_module('spacy.tokens')
+    tokens.Token = MinimalToken
+
+    training = _new_stub_module('spacy.training')
+    training.Alignment = MinimalAlignment
+
+    spacy.util = util
+    spacy.cli = cli
+    spacy.tokens = tokens
+    spacy.training = training
+
+
+def _new_stub_module(name: str, is_package: bool = False) -> types.ModuleType:
+    """Create an empty module and register it in sys.modules."""
+    module = types.ModuleType(name)
+    # A spec keeps importlib.util.find_spec() working for availability checks
+    module.__spec__ = importlib.machinery.ModuleSpec(
+        name, None, is_package=is_package
+    )
+    if is_package:
+        module.__path__ = []
+    sys.modules[name] = module
+    return module
+
+
 def _create_minimal_tokenizer():
     """
-    Create a minimal spaCy-compatible tokenizer.
+    Return the minimal spaCy-compatible tokenizer.
 
     This provides just enough functionality for misaki's g2p pipeline
-    without loading the full en_core_web_sm model.
+    without loading the full en_core_web_sm model. The model is stateless,
+    so every spacy.load() call shares a single instance.
     """
-    class MinimalToken:
-        """Minimal token that satisfies misaki's requirements."""
-        def __init__(self, text: str, has_space: bool = True):
-            self.text = text
-            self.text_with_ws = text + (" " if has_space else "")
-            self.whitespace_ = " " if has_space else ""
-            self.tag_ = "NN"
-            self.pos_ = "NOUN"
-            self.lemma_ = text.lower()
-
-    class MinimalTokenizer:
-        """Simple whitespace tokenizer."""
-        def __call__(self, text: str):
-            words = text.split()
-            tokens = []
-            for i, word in enumerate(words):
-                has_space = i < len(words) - 1
-                tokens.append(MinimalToken(word, has_space))
-            return tokens
-
-    class MinimalModel:
-        """Minimal spaCy model compatible with misaki."""
-        def __init__(self):
-            self.tokenizer = MinimalTokenizer()
-
-        def __call__(self, text: str):
-            return self.tokenizer(text)
-
-    return MinimalModel()
+    global _minimal_model
+    if _minimal_model is None:
+        _minimal_model = MinimalModel()
+    return _minimal_model
 
 
 def suppress_spacy_warnings():
@@ -198,14 +325,16 @@ def apply_all_patches() -> dict:
     Apply all necessary patches for frozen environment compatibility.
 
     Call this early in the application startup, before importing kokoro.
+    Subsequent calls are no-ops and return the results of the first one.
 
     Returns:
         Dict with patch names and their success status
     """
-    results = {}
+    global _patch_results
+    if _patch_results is not None:
+        return dict(_patch_results)
 
-    # CRITICAL: Protect sys.argv first (before any imports)
-    results['argv_protection'] = protect_argv()
+    results = {}
 
     # Suppress warnings
     suppress_spacy_warnings()
@@ -217,4 +346,5 @@ def apply_all_patches() -> dict:
     # Patch spaCy load
     results['spacy_load'] = patch_spacy_load()
 
-    return results
+    _patch_results = results
+    return dict(results)
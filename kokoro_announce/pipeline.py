@@ -7,17 +7,98 @@ local bundled models and HuggingFace downloads.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import os
+import tempfile
+import threading
 import warnings
 from pathlib import Path
 from typing import Optional
 
-from .config import KokoroSettings
-from .local_models import get_model_paths, models_exist, download_models
+from . import __version__
+from .config import REPO_ID, KokoroSettings
+from .local_models import (
+    configure_ssl,
+    download_models,
+    get_kokoro_version,
+    get_model_paths,
+    models_exist,
+)
+from .validation import validate_backend, validate_quantize
 
 # Suppress known harmless warnings
 warnings.filterwarnings('ignore', message='dropout option adds dropout after all but last recurrent layer')
 warnings.filterwarnings('ignore', message='.*torch.nn.utils.weight_norm.*is deprecated.*')
 
+# Exported ONNX models for the 'onnx' backend
+ONNX_CACHE_DIR = Path.home() / ".cache" / "kokoro_announce" / "onnx"
+
+
+# torch.load is patched while any thread is inside _mmap_torch_load(); only
+# calls made from those threads get mmap=True
+_mmap_lock = threading.Lock()
+_mmap_users = 0
+_mmap_original_load = None
+_mmap_local = threading.local()
+
+
+@contextlib.contextmanager
+def _mmap_torch_load():
+    """
+    Make torch.load memory-map checkpoints for the duration of the block.
+
+    KModel loads its weights with a plain torch.load call, which reads the
+    whole ~310 MB file into memory before copying it into the model. With
+    mmap=True the tensors are paged in from the file as they are copied,
+    so peak memory drops by about one checkpoint.
+
+    The patch is shared by concurrent users (reference counted under a
+    module lock, so the real torch.load is always what gets restored) and
+    only applies to the calling thread; torch.load calls elsewhere in the
+    process are passed through unchanged.
+    """
+    global _mmap_users, _mmap_original_load
+    import torch
+
+    with _mmap_lock:
+        if _mmap_users == 0:
+            original = torch.load
+            _mmap_original_load = original
+
+            @functools.wraps(original)
+            def load(*args, **kwargs):
+                if getattr(_mmap_local, "active", False):
+                    kwargs.setdefault("mmap", True)
+                return original(*args, **kwargs)
+
+            torch.load = load
+        _mmap_users += 1
+
+    was_active = getattr(_mmap_local, "active", False)
+    _mmap_local.active = True
+    try:
+        yield
+    finally:
+        _mmap_local.active = was_active
+        with _mmap_lock:
+            _mmap_users -= 1
+            if _mmap_users == 0:
+                torch.load = _mmap_original_load
+                _mmap_original_load = None
+
+
+def _on_device(model, device: str) -> bool:
+    """Return True if model already lives on device ('cuda' matches any GPU)."""
+    import torch
+
+    target = torch.device(device)
+    current = model.device
+    if target.index is None:
+        return current.type == target.type
+    return current == target
+
 
 class PipelineFactory:
     """
@@ -39,6 +120,7 @@ class PipelineFactory:
         """
         self.settings = settings
         self._pipeline = None
+        self._lock = threading.Lock()
 
     def get(self):
         """
@@ -47,12 +129,18 @@ class PipelineFactory:
         On first call, initializes the pipeline using local models if
         available, otherwise downloads from HuggingFace.
 
+        Thread-safe: concurrent first calls build the model only once.
+
         Returns:
             Configured KPipeline instance
         """
-        if self._pipeline is None:
-            self._pipeline = self._create_pipeline()
-        return self._pipeline
+        pipeline = self._pipeline
+        if pipeline is None:
+            with self._lock:
+                if self._pipeline is None:
+                    self._pipeline = self._create_pipeline()
+                pipeline = self._pipeline
+        return pipeline
 
     def _create_pipeline(self):
         """
@@ -69,6 +157,10 @@ class PipelineFactory:
         use_local = models_exist()
 
         if not use_local:
+            # The download, or kokoro's own HuggingFace fetches in the
+            # remote pipeline, need the SSL workarounds
+            configure_ssl()
+
             # Try to download models
             if download_models():
                 use_local = True
@@ -95,22 +187,32 @@ class PipelineFactory:
         if not model_path.exists():
             raise FileNotFoundError(f"Model weights not found: {model_path}")
 
+        import torch
+
         # Create model with local files
         # Note: KModel internally uses torch.load - we trust bundled models
-        model = KModel(
-            repo_id='hexgrad/Kokoro-82M',
-            config=model_paths['config'],
-            model=model_paths['model'],
-        )
+        # No autograd state is needed for inference. no_grad rather than
+        # inference_mode: inference tensors can't be updated in place later
+        # (dynamic quantization) outside an inference_mode block.
+        with _mmap_torch_load(), torch.no_grad():
+            model = KModel(
+                repo_id=REPO_ID,
+                config=model_paths['config'],
+                model=model_paths['model'],
+                # ONNX export can't trace complex STFT ops
+                disable_complex=validate_backend(self.settings.backend) == "onnx",
+            )
 
-        # Move to device if specified
-        if self.settings.device:
-            model = model.to(self.settings.device)
-        model = model.eval()
+            model = model.eval().requires_grad_(False)
+            # Move to device if specified (KModel loads onto the CPU)
+            if self.settings.device and not _on_device(model, self.settings.device):
+                model = model.to(self.settings.device)
+        self._apply_quantization(model)
+        self._apply_backend(model, model_paths['model'])
 
         return KPipeline(
             lang_code=self.settings.lang_code,
-            repo_id='hexgrad/Kokoro-82M',
+            repo_id=REPO_ID,
             model=model,
         )
 
@@ -120,11 +222,244 @@ class PipelineFactory:
 
         Falls back to this when local models aren't available.
         """
-        return KPipeline(
+        pipeline = KPipeline(
             lang_code=self.settings.lang_code,
             device=self.settings.device,
-            repo_id='hexgrad/Kokoro-82M',
+            repo_id=REPO_ID,
+        )
+        if pipeline.model is not None:
+            pipeline.model.requires_grad_(False)
+            self._apply_quantization(pipeline.model)
+            self._apply_backend(pipeline.model)
+        return pipeline
+
+    def _apply_quantization(self, model) -> None:
+        """
+        Quantize a loaded KModel's weights for CPU inference.
+
+        Dynamic int8 quantization converts the Linear weights once;
+        activations stay in fp32, so audio quality is largely preserved.
+        LSTMs are left in fp32: the quantized LSTM has no
+        flatten_parameters(), which kokoro's encoders call on every forward.
+        Quantizing takes well under a second, so the result isn't cached on
+        disk (a saved quantized state_dict still needs the fp32 model built
+        and quantized before it can be loaded).
+        """
+        quantize = validate_quantize(self.settings.quantize)
+        if quantize is None:
+            return
+
+        if model.device.type != "cpu":
+            warnings.warn(f"Quantization '{quantize}' only applies to CPU inference; ignoring")
+            return
+
+        import torch
+
+        torch.ao.quantization.quantize_dynamic(
+            model,
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+            inplace=True,
+        )
+
+    def _apply_backend(self, model, weights_path: Optional[str] = None) -> None:
+        """
+        Apply the configured inference backend to a loaded KModel.
+
+        Compilation happens lazily on the first forward pass, so it does
+        not slow down pipeline creation. Falls back to eager PyTorch (with
+        a warning) when the backend can't be used.
+
+        Args:
+            model: Loaded KModel
+            weights_path: Weights file the model was loaded from, used to
+                key the ONNX export cache (None for the remote pipeline)
+        """
+        backend = validate_backend(self.settings.backend)
+        if backend == "eager":
+            return
+
+        if backend == "onnx":
+            self._apply_onnx(model, weights_path)
+            return
+
+        if model.device.type != "cuda":
+            warnings.warn(f"Backend '{backend}' requires a CUDA device; using eager PyTorch")
+            return
+
+        import torch
+
+        if backend == "tensorrt":
+            try:
+                import torch_tensorrt  # noqa: F401  (registers the compile backend)
+            except ImportError:
+                warnings.warn("torch_tensorrt is not installed; using eager PyTorch")
+                return
+
+            # Segment lengths vary, so compile with dynamic shapes to avoid
+            # rebuilding the engine for every new input length
+            model.forward_with_tokens = torch.compile(
+                model.forward_with_tokens,
+                backend="torch_tensorrt",
+                dynamic=True,
+            )
+
+        elif backend == "cudagraphs":
+            # reduce-overhead captures a CUDA graph per input shape and
+            # replays it, removing per-kernel launch overhead. Inputs can't
+            # be padded to shared buckets since padding changes the
+            # predicted durations, so each new segment length records once.
+            model.forward_with_tokens = torch.compile(
+                model.forward_with_tokens,
+                mode="reduce-overhead",
+            )
+
+    def _apply_onnx(self, model, weights_path: Optional[str] = None) -> None:
+        """
+        Run the model through ONNX Runtime instead of PyTorch.
+
+        The model is exported once and cached under ONNX_CACHE_DIR (see
+        _onnx_cache_path). Uses the CUDA execution provider when the model
+        is on a GPU.
+        """
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError:
+            warnings.warn("onnxruntime is not installed; using eager PyTorch")
+            return
+
+        import numpy as np
+        import torch
+
+        try:
+            onnx_path = self._onnx_cache_path(weights_path)
+            use_cuda = model.device.type == "cuda"
+            if onnx_path is None:
+                # Weights can't be identified, so the export can't be reused
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    tmp_path = self.export_onnx(model, Path(tmp_dir) / "kokoro.onnx")
+                    session = self.build_onnx_session(tmp_path, use_cuda=use_cuda)
+            else:
+                if not onnx_path.exists():
+                    self.export_onnx(model, onnx_path)
+                session = self.build_onnx_session(onnx_path, use_cuda=use_cuda)
+        except Exception as e:
+            warnings.warn(f"ONNX backend unavailable ({e}); using eager PyTorch")
+            return
+
+        def onnx_forward_with_tokens(input_ids, ref_s, speed=1):
+            # Inputs are a few KB and the audio has to end up on the CPU
+            # anyway, so plain run() is used rather than IO binding
+            audio, pred_dur = session.run(None, {
+                "input_ids": input_ids.cpu().numpy(),
+                "ref_s": ref_s.float().cpu().numpy(),
+                "speed": np.array([speed], dtype=np.float32),
+            })
+            return torch.from_numpy(audio), torch.from_numpy(pred_dur)
+
+        model.forward_with_tokens = onnx_forward_with_tokens
+
+    def _onnx_cache_path(self, weights_path: Optional[str]) -> Optional[Path]:
+        """
+        Cache file for the ONNX export of the given weights.
+
+        The name is a hash of everything that changes the exported graph:
+        the weights file (size and mtime), the kokoro and package versions,
+        and the quantization setting.
+
+        Args:
+            weights_path: Local weights file, or None for the remote
+                pipeline (looked up in the HuggingFace cache)
+
+        Returns:
+            Cache path, or None if the weights file can't be found
+        """
+        if weights_path is None:
+            from huggingface_hub import try_to_load_from_cache
+
+            weights_path = try_to_load_from_cache(REPO_ID, "kokoro-v1_0.pth")
+            if not isinstance(weights_path, str):
+                return None
+
+        try:
+            stat = os.stat(weights_path)
+        except OSError:
+            return None
+
+        data = "|".join(str(part) for part in (
+            stat.st_size,
+            stat.st_mtime_ns,
+            get_kokoro_version(),
+            __version__,
+            validate_quantize(self.settings.quantize),
+        ))
+        digest = hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+        return ONNX_CACHE_DIR / f"kokoro-v1_0-{digest}.onnx"
+
+    @staticmethod
+    def export_onnx(model, onnx_path: Path) -> Path:
+        """
+        Export a KModel to ONNX.
+
+        The model must have been created with disable_complex=True.
+
+        Args:
+            model: Loaded KModel
+            onnx_path: Destination file
+
+        Returns:
+            Path to the exported model
+        """
+        import torch
+        from kokoro.model import KModelForONNX
+
+        onnx_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = onnx_path.with_suffix(".tmp")
+
+        input_ids = torch.LongTensor([[0, *range(1, 13), 0]]).to(model.device)
+        ref_s = torch.randn(1, 256, device=model.device)
+        speed = torch.tensor([1.0], device=model.device)
+
+        torch.onnx.export(
+            KModelForONNX(model).eval(),
+            (input_ids, ref_s, speed),
+            str(tmp_path),
+            input_names=["input_ids", "ref_s", "speed"],
+            output_names=["waveform", "duration"],
+            dynamic_axes={
+                "input_ids": {1: "num_tokens"},
+                "waveform": {0: "num_samples"},
+                "duration": {0: "num_tokens"},
+            },
+            opset_version=17,
+            do_constant_folding=True,
+            dynamo=False,
         )
+        # Only publish complete exports to the cache
+        os.replace(tmp_path, onnx_path)
+        return onnx_path
+
+    @staticmethod
+    def build_onnx_session(model_path: Path, use_cuda: bool = False):
+        """
+        Create an ONNX Runtime session for an exported model.
+
+        Args:
+            model_path: Path to the .onnx file
+            use_cuda: Prefer the CUDA execution provider
+
+        Returns:
+            onnxruntime.InferenceSession
+        """
+        import onnxruntime as ort
+
+        providers = ["CPUExecutionProvider"]
+        if use_cuda and "CUDAExecutionProvider" in ort.get_available_providers():
+            providers.insert(0, "CUDAExecutionProvider")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return ort.InferenceSession(str(model_path), options, providers=providers)
 
     def reset(self) -> None:
         """
@@ -132,4 +467,5 @@ class PipelineFactory:
 
         Call this to reload the model, e.g., when changing devices.
         """
-        self._pipeline = None
+        with self._lock:
+            self._pipeline = None
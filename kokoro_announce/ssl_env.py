@@ -0,0 +1,81 @@
+"""
+Persisted SSL bypass settings.
+
+fix_ssl.py saves the environment variables it sets to ~/.kokoro/ssl.env,
+so later runs of the CLI and download_models.py pick them up without the
+user having to rerun the interactive tool in every new shell.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+SSL_ENV_PATH = Path.home() / ".kokoro" / "ssl.env"
+
+
+def load_ssl_env(path: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Load saved SSL settings into os.environ.
+
+    Variables already set in the environment take precedence over the file.
+    The format is one KEY=VALUE per line; blank lines and # comments are
+    ignored.
+
+    Args:
+        path: Settings file (default: ~/.kokoro/ssl.env)
+
+    Returns:
+        Dict of variables read from the file (empty if there is none)
+    """
+    path = path or SSL_ENV_PATH
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+
+    loaded = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        key, value = key.strip(), value.strip()
+        loaded[key] = value
+        os.environ.setdefault(key, value)
+
+    return loaded
+
+
+def save_ssl_env(env: Dict[str, str], path: Optional[Path] = None) -> Path:
+    """
+    Save SSL settings so future runs load them automatically.
+
+    Args:
+        env: Environment variables to persist
+        path: Settings file (default: ~/.kokoro/ssl.env)
+
+    Returns:
+        Path to the written file
+    """
+    path = path or SSL_ENV_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    lines = ["# Written by fix_ssl.py. Delete this file to restore SSL verification."]
+    lines.extend(f"{key}={value}" for key, value in env.items())
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def clear_ssl_env(path: Optional[Path] = None) -> bool:
+    """
+    Remove saved SSL settings.
+
+    Returns:
+        True if a settings file was removed
+    """
+    path = path or SSL_ENV_PATH
+    try:
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
@@ -7,10 +7,15 @@ Provides secure validation for:
 - Voice file names
 """
 
+from functools import lru_cache
 from pathlib import Path
+import os
 import re
+import stat
+import string
 import sys
-from typing import Optional, Tuple
+import tempfile
+from typing import Any, Dict, Optional, Tuple
 
 # Validation constants
 MIN_SPEED = 0.25
@@ -20,7 +25,29 @@ MAX_TEXT_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 VALID_DEVICES = frozenset(['cpu', 'cuda', 'mps', 'cuda:0', 'cuda:1', 'cuda:2', 'cuda:3'])
 VALID_OUTPUT_FORMATS = frozenset(['wav', 'mp3'])
 VALID_SAMPLE_RATES = frozenset([8000, 16000, 22050, 24000, 44100, 48000])
-VOICE_NAME_PATTERN = re.compile(r'^[a-z]{2}_[a-z0-9_]+$')
+VALID_BACKENDS = frozenset(['eager', 'tensorrt', 'cudagraphs', 'onnx'])
+VALID_QUANTIZATIONS = frozenset(['int8'])
+VALID_LANG_CODES = frozenset(['a', 'b', 'e', 'f'])
+VOICE_NAME_PATTERN = re.compile(r'[a-z]{2}_[a-z0-9_]+', re.ASCII)  # use fullmatch()
+
+# Character sets for the voice name fast path (same grammar as the pattern)
+_VOICE_PREFIX_CHARS = frozenset(string.ascii_lowercase)
+_VOICE_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + '_')
+
+# Option lists and limits for error messages, built once
+_VALID_DEVICES_STR = ', '.join(sorted(VALID_DEVICES))
+_VALID_OUTPUT_FORMATS_STR = ', '.join(sorted(VALID_OUTPUT_FORMATS))
+_VALID_SAMPLE_RATES_STR = ', '.join(str(r) for r in sorted(VALID_SAMPLE_RATES))
+_VALID_BACKENDS_STR = ', '.join(sorted(VALID_BACKENDS))
+_VALID_QUANTIZATIONS_STR = ', '.join(sorted(VALID_QUANTIZATIONS))
+_VALID_LANG_CODES_STR = ', '.join(sorted(VALID_LANG_CODES))
+_MAX_TEXT_FILE_SIZE_MB = MAX_TEXT_FILE_SIZE // (1024 * 1024)
+
+# Validators return these interned instances, so later comparisons against
+# the same values can short-circuit on identity
+_DEVICE_CANONICAL = {d: sys.intern(d) for d in VALID_DEVICES}
+_OUTPUT_FORMAT_CANONICAL = {f: sys.intern(f) for f in VALID_OUTPUT_FORMATS}
+_LANG_CODE_CANONICAL = {c: sys.intern(c) for c in VALID_LANG_CODES}
 
 
 class ValidationError(ValueError):
@@ -28,6 +55,25 @@ class ValidationError(ValueError):
     pass
 
 
+class TypeValidationError(ValidationError):
+    """
+    Raised when an input has the wrong type.
+
+    Callers can inspect field and got_type instead of parsing the message,
+    which is only formatted if the error is printed.
+    """
+
+    def __init__(self, field: str, expected: str, got_type: type) -> None:
+        super().__init__(field, expected, got_type)
+        self.field = field
+        self.expected = expected
+        self.got_type = got_type
+
+    def __str__(self) -> str:
+        return f"{self.field} must be {self.expected}, got {self.got_type.__name__}"
+
+
+@lru_cache(maxsize=1)
 def get_safe_base_paths() -> Tuple[Path, ...]:
     """
     Get list of safe base paths for file operations.
@@ -37,9 +83,10 @@ def get_safe_base_paths() -> Tuple[Path, ...]:
     - User's home directory
     - Temp directory
     - PyInstaller bundle directory (if frozen)
-    """
-    import tempfile
 
+    Resolved once and cached; call clear_path_caches() after changing the
+    working directory.
+    """
     safe_paths = [
         Path.cwd(),
         Path.home(),
@@ -53,45 +100,116 @@ def get_safe_base_paths() -> Tuple[Path, ...]:
     return tuple(p.resolve() for p in safe_paths)
 
 
-def is_path_safe(path: Path, allow_creation: bool = False) -> bool:
+def is_path_safe(
+    path: Path,
+    allow_creation: bool = False,
+    exists: Optional[bool] = None,
+) -> bool:
     """
     Check if a path is safe for file operations.
 
     Prevents directory traversal attacks by ensuring the path
-    is within allowed directories.
+    is within allowed directories. Symbolic links are rejected outright:
+    once resolve() has followed a link there is no trace of it left to
+    check.
+
+    The symlink check runs on every call. For existing files the
+    resolution result is memoized per absolute path and parent directory
+    identity, so a changed working directory or a parent replaced by
+    another directory or a symlink is re-checked (see _resolve_is_safe).
 
     Args:
-        path: Path to validate
-        allow_creation: If True, check parent for non-existent files
+        path: Path to validate (unresolved)
+        allow_creation: If True, path may not exist yet (a file about to
+            be created); otherwise a missing path is rejected
+        exists: True if the caller has already lstat()ed path and found
+            it is not a symlink (None to check)
 
     Returns:
         True if path is safe, False otherwise
     """
-    try:
-        # Resolve to absolute path (handles .., symlinks, etc.)
-        if path.exists():
-            resolved = path.resolve()
-        elif allow_creation and path.parent.exists():
-            resolved = path.parent.resolve() / path.name
+    if exists is None:
+        try:
+            st = os.lstat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            exists = False
+        except (OSError, ValueError):
+            return False
         else:
-            # For new files, resolve the parent
-            resolved = path.resolve()
+            if stat.S_ISLNK(st.st_mode):
+                return False
+            exists = True
+
+    try:
+        # Absolute, but without collapsing '..' (its meaning depends on
+        # symlinks), so the key is independent of the working directory
+        path_str = os.path.join(os.getcwd(), os.fspath(path))
+        if not exists:
+            if not allow_creation:
+                return False
+            # Paths that don't exist yet (new output files) can change
+            # under us before they're created; don't memoize them
+            return _resolve_is_safe.__wrapped__(path_str)
+
+        parent = os.lstat(os.path.dirname(path_str))
+    except (OSError, ValueError):
+        return False
 
-        safe_bases = get_safe_base_paths()
+    if stat.S_ISLNK(parent.st_mode):
+        return _resolve_is_safe.__wrapped__(path_str)
+    return _resolve_is_safe(path_str, parent.st_dev, parent.st_ino)
 
-        # Check if path is under any safe base
-        for safe_base in safe_bases:
-            try:
-                resolved.relative_to(safe_base)
-                return True
-            except ValueError:
-                continue
 
-        return False
+@lru_cache(maxsize=4096)
+def _resolve_is_safe(path_str: str, parent_dev: int = 0, parent_ino: int = 0) -> bool:
+    """
+    Resolve path_str and check that it lies under a safe base path.
 
+    parent_dev/parent_ino only key the cache: if the parent directory is
+    replaced, the path is resolved again.
+    """
+    try:
+        # Resolve to absolute path (handles .., symlinked parents, etc.).
+        # A missing final component is kept as is, which is what new
+        # output files need.
+        real = os.path.normcase(os.path.realpath(path_str))
     except (OSError, ValueError):
         return False
 
+    # Check if path is under any safe base
+    return any(
+        real == base or real.startswith(prefix)
+        for base, prefix in _safe_base_strs()
+    )
+
+
+@lru_cache(maxsize=1)
+def _safe_base_strs() -> Tuple[Tuple[str, str], ...]:
+    """
+    get_safe_base_paths() as normalized (base, base + separator) pairs.
+
+    The trailing separator keeps /home/user2 from matching /home/user.
+    """
+    pairs = []
+    for path in get_safe_base_paths():
+        base = os.path.normcase(str(path))
+        # A root base such as / already ends with the separator
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        pairs.append((base, prefix))
+    return tuple(pairs)
+
+
+def clear_path_caches() -> None:
+    """
+    Forget cached safe base paths and path resolutions.
+
+    Call after changing the working directory, or the home or temp
+    directory, so is_path_safe() checks against the new locations.
+    """
+    get_safe_base_paths.cache_clear()
+    _safe_base_strs.cache_clear()
+    _resolve_is_safe.cache_clear()
+
 
 def validate_input_path(path: Path, purpose: str = "input") -> Path:
     """
@@ -107,23 +225,48 @@ def validate_input_path(path: Path, purpose: str = "input") -> Path:
     Raises:
         ValidationError: If path is invalid or unsafe
     """
-    if not path.exists():
+    # One lstat for the symlink, existence, type and size checks
+    try:
+        st = os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
         raise ValidationError(f"{purpose} file not found: {path}")
+    except OSError as e:
+        raise ValidationError(f"{purpose} file cannot be read: {path} ({e.strerror})")
+
+    if stat.S_ISLNK(st.st_mode):
+        raise ValidationError(f"{purpose} path is a symbolic link: {path}")
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValidationError(f"{purpose} path is not a file: {path}")
 
-    if not is_path_safe(path):
+    if not is_path_safe(path, exists=True):
         raise ValidationError(f"{purpose} path is outside allowed directories: {path}")
 
     # Check file size for text files
-    if path.stat().st_size > MAX_TEXT_FILE_SIZE:
+    if st.st_size > MAX_TEXT_FILE_SIZE:
         raise ValidationError(
-            f"{purpose} file too large: {path.stat().st_size / 1024 / 1024:.1f}MB "
-            f"(max {MAX_TEXT_FILE_SIZE / 1024 / 1024:.0f}MB)"
+            f"{purpose} file too large: {st.st_size / (1024 * 1024):.1f}MB "
+            f"(max {_MAX_TEXT_FILE_SIZE_MB}MB)"
         )
 
-    return path.resolve()
+    return _absolute(path)
+
+
+def _absolute(path: Path) -> Path:
+    """
+    Return an absolute form of an already validated path.
+
+    resolve() costs an lstat per path component, and is_path_safe() has
+    just walked the same components. It is only needed for '..' parts,
+    whose meaning depends on symlinks; otherwise the path is joined to
+    the working directory (one getcwd call). The final component is
+    known not to be a symlink by now.
+    """
+    if '..' in path.parts:
+        return path.resolve()
+    if path.is_absolute():
+        return path
+    return Path.cwd() / path
 
 
 def validate_output_path(path: Path, purpose: str = "output") -> Path:
@@ -140,11 +283,12 @@ def validate_output_path(path: Path, purpose: str = "output") -> Path:
     Raises:
         ValidationError: If path is invalid or unsafe
     """
-    resolved = path.resolve()
-
-    if not is_path_safe(resolved, allow_creation=True):
+    # Check before resolving, so an existing symlink is still visible
+    if not is_path_safe(path, allow_creation=True):
         raise ValidationError(f"{purpose} path is outside allowed directories: {path}")
 
+    resolved = _absolute(path)
+
     # Check parent directory exists or can be created
     if not resolved.parent.exists():
         # Will be created by synthesize_to_file
@@ -166,15 +310,18 @@ def validate_speed(speed: float) -> float:
     Raises:
         ValidationError: If speed is out of bounds
     """
-    if not isinstance(speed, (int, float)):
-        raise ValidationError(f"Speed must be a number, got {type(speed).__name__}")
+    try:
+        value = float(speed)
+    except (TypeError, ValueError):
+        raise TypeValidationError("Speed", "a number", type(speed))
 
-    if speed < MIN_SPEED or speed > MAX_SPEED:
+    # Written as a chained comparison so NaN is rejected too
+    if not MIN_SPEED <= value <= MAX_SPEED:
         raise ValidationError(
             f"Speed must be between {MIN_SPEED} and {MAX_SPEED}, got {speed}"
         )
 
-    return float(speed)
+    return value
 
 
 def validate_device(device: Optional[str]) -> Optional[str]:
@@ -193,14 +340,17 @@ def validate_device(device: Optional[str]) -> Optional[str]:
     if device is None:
         return None
 
-    device = device.lower().strip()
+    # Exact matches (the common case) need no normalization
+    canonical = _DEVICE_CANONICAL.get(device)
+    if canonical is None:
+        device = device.lower().strip()
+        canonical = _DEVICE_CANONICAL.get(device)
+        if canonical is None:
+            raise ValidationError(
+                f"Invalid device '{device}'. Valid options: {_VALID_DEVICES_STR}"
+            )
 
-    if device not in VALID_DEVICES:
-        raise ValidationError(
-            f"Invalid device '{device}'. Valid options: {', '.join(sorted(VALID_DEVICES))}"
-        )
-
-    return device
+    return canonical
 
 
 def validate_text(text: str) -> str:
@@ -217,9 +367,11 @@ def validate_text(text: str) -> str:
         ValidationError: If text is empty or too long
     """
     if not isinstance(text, str):
-        raise ValidationError(f"Text must be a string, got {type(text).__name__}")
+        raise TypeValidationError("Text", "a string", type(text))
 
-    text = text.strip()
+    # strip() copies the string; skip it when there is nothing to remove
+    if text and (text[0].isspace() or text[-1].isspace()):
+        text = text.strip()
 
     if not text:
         raise ValidationError("Text cannot be empty")
@@ -248,7 +400,7 @@ def validate_sample_rate(sample_rate: int) -> int:
     if sample_rate not in VALID_SAMPLE_RATES:
         raise ValidationError(
             f"Invalid sample rate {sample_rate}. "
-            f"Valid options: {', '.join(str(r) for r in sorted(VALID_SAMPLE_RATES))}"
+            f"Valid options: {_VALID_SAMPLE_RATES_STR}"
         )
 
     return sample_rate
@@ -267,14 +419,65 @@ def validate_output_format(fmt: str) -> str:
     Raises:
         ValidationError: If format is invalid
     """
-    fmt = fmt.lower().strip()
+    canonical = _OUTPUT_FORMAT_CANONICAL.get(fmt)
+    if canonical is None:
+        fmt = fmt.lower().strip()
+        canonical = _OUTPUT_FORMAT_CANONICAL.get(fmt)
+        if canonical is None:
+            raise ValidationError(
+                f"Invalid output format '{fmt}'. Valid options: {_VALID_OUTPUT_FORMATS_STR}"
+            )
+
+    return canonical
+
+
+def validate_backend(backend: str) -> str:
+    """
+    Validate inference backend name.
+
+    Args:
+        backend: Backend name (eager, tensorrt, cudagraphs, onnx)
+
+    Returns:
+        Validated backend (lowercase)
+
+    Raises:
+        ValidationError: If backend is invalid
+    """
+    backend = backend.lower().strip()
 
-    if fmt not in VALID_OUTPUT_FORMATS:
+    if backend not in VALID_BACKENDS:
         raise ValidationError(
-            f"Invalid output format '{fmt}'. Valid options: {', '.join(sorted(VALID_OUTPUT_FORMATS))}"
+            f"Invalid backend '{backend}'. Valid options: {_VALID_BACKENDS_STR}"
         )
 
-    return fmt
+    return backend
+
+
+def validate_quantize(quantize: Optional[str]) -> Optional[str]:
+    """
+    Validate weight quantization mode.
+
+    Args:
+        quantize: Quantization mode (int8) or None to disable
+
+    Returns:
+        Validated mode (lowercase) or None
+
+    Raises:
+        ValidationError: If mode is invalid
+    """
+    if quantize is None:
+        return None
+
+    quantize = quantize.lower().strip()
+
+    if quantize not in VALID_QUANTIZATIONS:
+        raise ValidationError(
+            f"Invalid quantization '{quantize}'. Valid options: {_VALID_QUANTIZATIONS_STR}"
+        )
+
+    return quantize
 
 
 def validate_voice_name(voice: str) -> str:
@@ -291,7 +494,7 @@ def validate_voice_name(voice: str) -> str:
         ValidationError: If voice name format is invalid
     """
     if not isinstance(voice, str):
-        raise ValidationError(f"Voice must be a string, got {type(voice).__name__}")
+        raise TypeValidationError("Voice", "a string", type(voice))
 
     voice = voice.strip()
 
@@ -299,8 +502,9 @@ def validate_voice_name(voice: str) -> str:
     if voice.endswith('.pt'):
         return voice
 
-    # Validate voice name pattern
-    if not VOICE_NAME_PATTERN.match(voice):
+    # Validate voice name pattern (VOICE_NAME_PATTERN, checked by a
+    # character scan instead of the regex engine)
+    if not _is_voice_name(voice):
         raise ValidationError(
             f"Invalid voice name format '{voice}'. "
             "Expected format: xx_name (e.g., af_heart, bm_lewis)"
@@ -309,6 +513,17 @@ def validate_voice_name(voice: str) -> str:
     return voice
 
 
+def _is_voice_name(voice: str) -> bool:
+    """Check voice against VOICE_NAME_PATTERN without the regex engine."""
+    return (
+        len(voice) >= 4
+        and voice[2] == '_'
+        and voice[0] in _VOICE_PREFIX_CHARS
+        and voice[1] in _VOICE_PREFIX_CHARS
+        and _VOICE_NAME_CHARS.issuperset(voice[3:])
+    )
+
+
 def validate_lang_code(lang: str) -> str:
     """
     Validate language code.
@@ -322,14 +537,68 @@ def validate_lang_code(lang: str) -> str:
     Raises:
         ValidationError: If language code is invalid
     """
-    valid_langs = {'a', 'b', 'e', 'f'}
+    canonical = _LANG_CODE_CANONICAL.get(lang)
+    if canonical is None:
+        lang = lang.lower().strip()
+        canonical = _LANG_CODE_CANONICAL.get(lang)
+        if canonical is None:
+            raise ValidationError(
+                f"Invalid language code '{lang}'. "
+                f"Valid options: {_VALID_LANG_CODES_STR}"
+            )
+
+    return canonical
+
+
+def validate_synthesis_args(
+    text: Optional[str] = None,
+    speed: float = 1.0,
+    device: Optional[str] = None,
+    voice: Optional[str] = None,
+    lang: Optional[str] = None,
+    sample_rate: Optional[int] = None,
+    fmt: Optional[str] = None,
+    input_path: Optional[Path] = None,
+    output_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Validate all inputs for one synthesis request.
 
-    lang = lang.lower().strip()
+    Constant-time checks run first, so a bad option is reported before
+    any file system access. Text is taken from text, or read from
+    input_path (UTF-8) if text is None. Arguments left as None are
+    skipped.
 
-    if lang not in valid_langs:
-        raise ValidationError(
-            f"Invalid language code '{lang}'. "
-            f"Valid options: {', '.join(sorted(valid_langs))}"
-        )
+    Returns:
+        Dict of normalized values, keyed by argument name ('text',
+        'speed', 'device', ...); 'input_path' is omitted
 
-    return lang
+    Raises:
+        ValidationError: If any input is invalid
+    """
+    values: Dict[str, Any] = {
+        'speed': validate_speed(speed),
+        'device': validate_device(device),
+    }
+    if voice is not None:
+        values['voice'] = validate_voice_name(voice)
+    if lang is not None:
+        values['lang'] = validate_lang_code(lang)
+    if sample_rate is not None:
+        values['sample_rate'] = validate_sample_rate(sample_rate)
+    if fmt is not None:
+        values['fmt'] = validate_output_format(fmt)
+
+    # Checks that touch the file system
+    if text is None and input_path is not None:
+        input_path = validate_input_path(input_path, "Text file")
+        try:
+            text = input_path.read_text(encoding="utf-8")
+        except UnicodeDecodeError as e:
+            raise ValidationError(f"Text file is not valid UTF-8: {e}")
+    if text is not None:
+        values['text'] = validate_text(text)
+    if output_path is not None:
+        values['output_path'] = validate_output_path(output_path, "Output file")
+
+    return values
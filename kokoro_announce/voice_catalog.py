@@ -0,0 +1,46 @@
+"""
+Catalog of supported Kokoro voices.
+
+Single source of truth for the voices downloaded by download_models.py
+and listed by the CLI. Supported languages: English (US/UK), French, Spanish.
+"""
+
+# (voice name, description) pairs, sorted by name within each language
+VOICES = (
+    # American English (20 voices)
+    ('af_alloy', 'American Female'),
+    ('af_aoede', 'American Female'),
+    ('af_bella', 'American Female'),
+    ('af_heart', 'American Female'),
+    ('af_jessica', 'American Female'),
+    ('af_kore', 'American Female'),
+    ('af_nicole', 'American Female'),
+    ('af_nova', 'American Female'),
+    ('af_river', 'American Female'),
+    ('af_sarah', 'American Female'),
+    ('af_sky', 'American Female'),
+    ('am_adam', 'American Male'),
+    ('am_echo', 'American Male'),
+    ('am_eric', 'American Male'),
+    ('am_fenrir', 'American Male'),
+    ('am_liam', 'American Male'),
+    ('am_michael', 'American Male'),
+    ('am_onyx', 'American Male'),
+    ('am_puck', 'American Male'),
+    ('am_santa', 'American Male'),
+    # British English (8 voices)
+    ('bf_alice', 'British Female'),
+    ('bf_emma', 'British Female'),
+    ('bf_isabella', 'British Female'),
+    ('bf_lily', 'British Female'),
+    ('bm_daniel', 'British Male'),
+    ('bm_fable', 'British Male'),
+    ('bm_george', 'British Male'),
+    ('bm_lewis', 'British Male'),
+    # Spanish (3 voices)
+    ('ef_dora', 'Spanish Female'),
+    ('em_alex', 'Spanish Male'),
+    ('em_santa', 'Spanish Male'),
+    # French (1 voice)
+    ('ff_siwis', 'French Female'),
+)